@@ -8,6 +8,7 @@
 #*  For FreeCAD Versions = 1.0.0 or >                                          *
 #*                                                                             *
 #*  History :                                                                  *
+#*    2026-10-18 : preferences page (loaded on demand), promote sketch         *
 #*    v 0.8 : 2026-03-04 : sections, frames...                                 *
 #*    v 0.5 : 2025-xx-xx : FreeCAD version 1.0.0 add sketch, frame...          *
 #*    v 0.1 : 2023-07-11 : Initial release for developpers only                *
@@ -36,6 +37,21 @@ adrWB_Tip = wb.translate("Ader", "Tools to design an airplane with CPACS")
 Gui.addLanguagePath(os.path.join(wb.base_path, "translations"))
 Gui.updateLocale()
 
+# Ader page in Edit > Preferences, adrPreferences imported when the page is opened
+class AderPreferencesPage:
+    def __init__(self):
+        import adrPreferences
+        self.page = adrPreferences.PreferencesPage()
+        self.form = self.page.form
+
+    def loadSettings(self):
+        self.page.loadSettings()
+
+    def saveSettings(self):
+        self.page.saveSettings()
+
+Gui.addPreferencePage(AderPreferencesPage, "Ader")
+
 
 class AderWorkbench(Workbench):
     def __init__(self):
@@ -54,7 +70,9 @@ class AderWorkbench(Workbench):
           import adrFrames         # build frames from sections 
           import adrFoil           # build a single airfoil section
           import adrNacelle        # buid a nacelle
+          import adrNacelleArray   # copies of a nacelle (links)
           import adrFrame          # build a single frame 
+          import adrPromoteSketch  # lean sketches to editable form
           import adrExport         # Export to CPACS xml file
         except ImportError as e:
           wb.consoleMsg(wb.translate(f"Missing modules: {e}"), type='E')
@@ -68,6 +86,7 @@ class AderWorkbench(Workbench):
             "adrFoil",
             "adrFrame",
             "adrNacelle",
+            "adrNacelleArray",
 
             "adrBuildFuselage",
             "adrBuildWings",
@@ -76,11 +95,13 @@ class AderWorkbench(Workbench):
         # creates a new toolbar with your commands
         self.appendToolbar("Ader", self.comdList)
         # creates a new menu
-        self.comdList+= ["adrExport"]
+        self.comdList+= ["adrPromoteSketch", "adrExport"]
         self.appendMenu("Ader", self.comdList)
 
     def Activated(self):
         # This function is executed when the workbench is activated
+        # foil catalog ready before the Foil panel opens
+        wb.PrewarmFoilCatalog()
         return
 
     def Deactivated(self):
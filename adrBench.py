@@ -0,0 +1,436 @@
+# -*- coding: utf-8 -*-
+# *******************************************************************************
+# *  Ader workbench                                                             *
+# *    For more details see InitGui.py and the LICENCE text file.               *
+# *                                                                             *
+# *  Module : adrBench.py                                                       *
+# *    Benchmarks of the Ader libraries, to run from the FreeCAD python console *
+# *      import adrBench                                                        *
+# *      adrBench.BenchDatParse()                                               *
+# *      adrBench.BenchNaca()                                                   *
+# *      adrBench.BenchNacelle()                                                *
+# *      adrBench.BenchNacelleVectors()  (FreeCAD required)                     *
+# *      adrBench.BenchSketch()          (FreeCAD required)                     *
+# *      adrBench.BenchFit()                                                    *
+# *      adrBench.BenchWingFit()         (FreeCAD required)                     *
+# *      adrBench.BenchBuildWings()      (FreeCAD required)                     *
+# *                                                                             *
+# *  Dependencies :                                                             *
+# *                                                                             *
+# *  History :                                                                  *
+# *    2026-10-18 : initial release : dat files parsing, NACA generators         *
+# *    2026-10-18 : dat files parsing runs without FreeCAD (adrLibGeom)          *
+# *    2026-10-18 : dat files parsing : coords vs original strings (no regex)    *
+# *    2026-10-18 : nacelle profiles, evenly spaced vs adaptive                  *
+# *    2026-10-18 : foil sketches, per point vs bulk construction                *
+# *    2026-10-18 : foil sketches benchmark independent of the preferences       *
+# *    2026-10-18 : foil splines, interpolated vs least squares fit              *
+# *    2026-10-18 : wing build (lofts) of a large foil, interpolated vs fitted   *
+# *    2026-10-18 : wing build of the example, with and without batch build,     *
+# *                 one transaction vs bulk (no undo), peak memory                *
+# *    2026-10-18 : wing build memory : process RSS (undo stack in FreeCAD/OCC)   *
+# *    2026-10-18 : wing build modes in fresh processes, timed and memory runs    *
+# *                 separated, recomputed sketches counted                        *
+# *                                                                             *
+# *******************************************************************************
+
+__title__ = "Ader Workbench - benchmarks"
+__author__ = "Claude GUTH"
+
+import os
+import sys
+import time
+
+def Timed(func, *args, repeat=3):
+    "best wall time of repeat calls, result of the last call"
+    best = None
+    for i in range(repeat):
+        t = time.perf_counter()
+        result = func(*args)
+        t = time.perf_counter() - t
+        best = t if best is None else min(best, t)
+    return best, result
+
+def LibraryFiles(folder=None, extensions=('.dat', '.cor', '.txt')):
+    if folder is None:
+        folder = os.path.join(os.path.dirname(__file__), 'dat_profiles')
+    return [os.path.join(folder, f) for f in sorted(os.listdir(folder)) if f.lower().endswith(extensions)]
+
+def BenchDatParse(folder=None):
+    "parse time of the whole library (adrLibDat) : coords, original strings (CPACS export)"
+    import adrLibDat
+
+    files = LibraryFiles(folder)
+
+    def parseAll(parse):
+        ok = 0
+        for f in files:
+            try:
+                parse(f)
+                ok += 1
+            except (ValueError, OSError):
+                pass
+        return ok
+
+    tCoords, okCoords = Timed(parseAll, adrLibDat.ReadDat)
+    tStrings, okStrings = Timed(parseAll, adrLibDat.ReadDatStrings)
+    print(f"{len(files)} files")
+    print(f"  coords           : {tCoords*1000:8.1f} ms, {okCoords} parsed")
+    print(f"  original strings : {tStrings*1000:8.1f} ms, {okStrings} parsed")
+    return tCoords, tStrings
+
+def BenchNaca(n=100):
+    "all 4 digit NACA combinations (m 0-9, p 0-9, tt 01-40) : one call per foil vs one batch"
+    import adrLibNaca
+    import adrLibShapes
+
+    params = adrLibNaca.Naca4Sweep()
+    numbers = [f"{round(m*100)}{round(p*10)}{round(t*100):02d}" for m, p, t in params]
+    x = adrLibNaca.Spacing(n, True)
+
+    tVectors, r = Timed(lambda: [adrLibShapes.naca4(d, n, False, True) for d in numbers], repeat=1)
+    tLoop, r = Timed(lambda: [adrLibNaca.Naca4([d], x) for d in numbers])
+    tBatch, coords = Timed(adrLibNaca.Naca4, params, x)
+    print(f"{len(numbers)} foils, {2*n + 1} points")
+    print(f"  per foil, vectors : {tVectors*1000:8.1f} ms")
+    print(f"  per foil, arrays  : {tLoop*1000:8.1f} ms")
+    print(f"  one batch         : {tBatch*1000:8.1f} ms, {len(numbers)/tBatch:,.0f} foils/s")
+    return tVectors, tLoop, tBatch
+
+def BenchNacelle(length=1000.0, diameter=400.0, nbPoints=100):
+    "points needed for the accuracy of nbPoints evenly spaced : adaptive sampling"
+    import numpy as np
+    import adrLibGeom
+
+    print(f"{length:g} x {diameter:g} mm, {nbPoints} evenly spaced points")
+    result = {}
+    for nacelleType in adrLibGeom.nacelleTypes:
+        law = adrLibGeom.nacelleLaws[nacelleType]
+        even = adrLibGeom.NacelleProfile(nacelleType, length, diameter, nbPoints=nbPoints)
+        # chord heights of the even profile, on a fine sampling of each segment
+        t = np.linspace(0.0, 1.0, 50)[:, None]
+        xFine = (even[:-1, 0] + t*np.diff(even[:, 0])).ravel(order='F')
+        fine = np.column_stack((xFine, law(xFine/length, length, diameter)))
+        segment = np.repeat(np.arange(len(even) - 1), len(t))
+        a, ab = even[segment], np.diff(even, axis=0)[segment]
+        error = float((np.abs(ab[:, 0]*(fine - a)[:, 1] - ab[:, 1]*(fine - a)[:, 0]) / np.hypot(*ab.T)).max())
+        tAdaptive, adaptive = Timed(adrLibGeom.NacelleProfile, nacelleType, length, diameter, 0.4, 0, error)
+        print(f"  {nacelleType:8s} : chord height {error:7.3f} mm, adaptive {len(adaptive):4d} points, {tAdaptive*1000:6.1f} ms")
+        result[nacelleType] = (error, len(adaptive))
+    return result
+
+def BenchNacelleVectors(nbPoints=3000, diameter=400.0):
+    """
+    mirrored nacelle outline as App.Vector : one symmetric array converted
+    (previous behaviour) vs mirrored blocks (adrLibPart.SymmetricVectors),
+    python peak memory (tracemalloc, App.Vector C++ part not seen)
+    """
+    import gc
+    import tracemalloc
+    import numpy as np
+    import adrLibGeom
+    import adrLibPart
+
+    def symmetricCopy(coords):
+        xyz = np.concatenate((coords.xyz[::-1], coords.xyz[1:]))
+        xyz[len(coords.xyz):, 1] *= -1.0
+        return adrLibPart.Vectors(adrLibGeom.Polyline(xyz))
+
+    result = {}
+    for name, func in (('copy', symmetricCopy), ('blocks', adrLibPart.SymmetricVectors)):
+        coords = adrLibGeom.Polyline(adrLibGeom.NacelleProfile('Lyon', 2.5*diameter, diameter, nbPoints=nbPoints))
+        gc.collect()
+        tracemalloc.start()
+        vects = func(coords)
+        kept, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  {name:8s} : {len(vects)} vectors, peak {peak/1024:6.0f} KB, kept {kept/1024:6.0f} KB")
+        result[name] = (peak, kept)
+    return result
+
+def LargestFoils(count=5, folder=None):
+    "library files with the most points"
+    import adrLibDat
+
+    sizes = []
+    for f in LibraryFiles(folder):
+        try:
+            sizes.append((len(adrLibDat.ReadDat(f)[1]), f))
+        except (ValueError, OSError):
+            pass
+    return [f for n, f in sorted(sizes, reverse=True)[:count]]
+
+def BenchSketch(count=5, folder=None):
+    """
+    wing tip sketch of the largest library foils : per point (before) vs
+    bulk (after) MakeSpline, full sketch interpolated, recompute included
+    """
+    import FreeCAD as App
+    import adrLibPart
+    import adrLibShapes
+
+    files = LargestFoils(count, folder)
+    doc = App.newDocument("AderBench")
+    body = doc.addObject('PartDesign::Body', 'Body')
+    result = {}
+    try:
+        print(f"{len(files)} foils")
+        for f in files:
+            name, coords = adrLibShapes.FoilPolylineFromDat(f, 100.0)
+            coords.Close()
+            times = []
+            for bulk in (False, True):
+                def build():
+                    # full sketch, interpolated : not the preferences (lean sketches, fit)
+                    sk = adrLibPart.MakeSpline(coords, 'skBench', 'XZ', body=body, bulk=bulk, lean=False, fit=0)
+                    doc.recompute()
+                    body.removeObject(sk)
+                    doc.removeObject(sk.Name)
+                times.append(Timed(build, repeat=2)[0])
+            print(f"  {os.path.basename(f):16s} {len(coords):4d} points : per point {times[0]*1000:8.1f} ms, bulk {times[1]*1000:8.1f} ms")
+            result[f] = times
+    finally:
+        App.closeDocument(doc.Name)
+    return result
+
+def BenchFit(count=5, chord=200.0, tolerance=0.05, folder=None):
+    "largest library foils : poles of the interpolated (1 per point) vs fitted B-spline"
+    import numpy as np
+    import adrLibGeom
+    import adrLibFit
+
+    result = {}
+    print(f"{count} foils, chord {chord:g} mm, tolerance {tolerance:g} mm")
+    for f in LargestFoils(count, folder):
+        name, coords = adrLibGeom.FoilCoords(f, chord)
+        points = np.vstack((coords, coords[:1]))
+        le = int(points[:, 0].argmin())
+        t, fit = Timed(adrLibFit.FitBSpline, points, tolerance, [le])
+        print(f"  {os.path.basename(f):16s} {len(points):4d} poles interpolated, {len(fit):4d} fitted, "
+              f"max deviation {fit.deviation:6.4f} mm, {t*1000:6.1f} ms")
+        result[f] = (len(points), len(fit), fit.deviation)
+    return result
+
+def BenchWingFit(tolerance=0.05, foil=None, filename=None, repeat=2):
+    """
+    wing build of an example document, a 150+ points foil (default : the
+    largest library foil, file points) on every surface : interpolated
+    vs fitted splines, lofts recomputed, best of repeat
+    """
+    import FreeCAD as App
+    import adrWBCommon as wb
+    import adrBuildWings
+
+    if filename is None:
+        filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'examples', 'F1776_spec.FCStd')
+    if foil is None:
+        foil = os.path.basename(LargestFoils(1)[0])
+    print(f"{os.path.basename(filename)}, {foil}, tolerance {tolerance:g} mm")
+    result = {}
+    for label, fit in (('interpolated', 0), ('fitted', tolerance)):
+        best = None
+        for i in range(repeat):
+            doc = App.openDocument(filename)
+            App.setActiveDocument(doc.Name)
+            try:
+                spec = doc.getObject("specifications")
+                for alias, value in (('ci_profile', foil), ('ce_profile', foil), ('vs_profile', foil),
+                                     ('hs_profile', foil), ('foil_points', '0')):
+                    cell = spec.getCellFromAlias(alias)
+                    if cell:
+                        spec.set(cell, value)
+                spec.recompute()
+                t = time.perf_counter()
+                with wb.BatchBuild(doc, viewFit=False, bulk=True):
+                    adrBuildWings.CommandBuildWings().Build(doc, spec, fit=fit)
+                t = time.perf_counter() - t
+            finally:
+                App.closeDocument(doc.Name)
+            best = t if best is None else min(best, t)
+        print(f"  {label:12s} : {best*1000:8.1f} ms")
+        result[label] = best
+    return result
+
+def ProcessRss():
+    "resident set size of the process (bytes) : psutil or /proc, None if unknown"
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1])*os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def PeakRss():
+    """
+    peak resident set size of the process (bytes) : /proc VmHWM (Linux, see
+    ResetPeakRss), psutil peak working set (Windows) or getrusage (kept
+    across fork and exec), None if unknown
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])*1024
+    except (OSError, ValueError):
+        pass
+    try:
+        import psutil
+        peak = getattr(psutil.Process().memory_info(), 'peak_wset', None)
+        if peak is not None:
+            return peak
+    except ImportError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak*1024
+
+def ResetPeakRss():
+    "peak RSS set to the current RSS (Linux 4.0+), False if not possible"
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except OSError:
+        return False
+    return True
+
+def Delta(after, before):
+    "after - before, None if unknown"
+    return None if after is None or before is None else after - before
+
+def KB(size):
+    return "     n/a KB" if size is None else f"{size/1024:8.0f} KB"
+
+# wing build modes : batch build, transaction name, bulk (no undo)
+buildModes = {'build': (False, None, False), 'transaction': (True, "Build wings", False), 'bulk': (True, None, True)}
+
+class RecomputeCounter:
+    "document observer : recomputed objects counted by type"
+    def __init__(self):
+        self.counts = {}
+
+    def slotRecomputedObject(self, obj):
+        self.counts[obj.TypeId] = self.counts.get(obj.TypeId, 0) + 1
+
+def BuildWings(filename, mode, memory=False):
+    """
+    one wing and stabilizers build of filename in mode (buildModes), the
+    document closed after. memory False : wall time (s), no tracing.
+    memory True : dict of the RSS growth (document open), peak RSS growth,
+    process peak RSS, python peak (tracemalloc), undo steps, recomputed
+    objects and sketches (document observer), not timed.
+    """
+    import gc
+    import tracemalloc
+    import FreeCAD as App
+    import adrWBCommon as wb
+    import adrBuildWings
+
+    batchBuilds, name, bulk = buildModes[mode]
+    batch = wb.batchBuilds
+    wb.batchBuilds = batchBuilds
+    doc = App.openDocument(filename)
+    App.setActiveDocument(doc.Name)
+    try:
+        gc.collect()
+        if memory:
+            counter = RecomputeCounter()
+            App.addDocumentObserver(counter)
+            ResetPeakRss()
+            rss, maxRss = ProcessRss(), PeakRss()
+            tracemalloc.start()
+        t = time.perf_counter()
+        with wb.BatchBuild(doc, viewFit=False, name=name, bulk=bulk):
+            adrBuildWings.CommandBuildWings().Build(doc, doc.getObject("specifications"))
+        t = time.perf_counter() - t
+        if not memory:
+            return t
+        return {'rss': Delta(ProcessRss(), rss), 'maxRss': Delta(PeakRss(), maxRss), 'processPeak': PeakRss(),
+                'peak': tracemalloc.get_traced_memory()[1], 'undos': doc.UndoCount,
+                'recomputes': sum(counter.counts.values()),
+                'sketchRecomputes': counter.counts.get('Sketcher::SketchObject', 0)}
+    finally:
+        if memory:
+            tracemalloc.stop()
+            App.removeDocumentObserver(counter)
+        App.closeDocument(doc.Name)
+        wb.batchBuilds = batch
+
+def BuildWingsMode(filename, mode, repeat=3):
+    "memory run first (peak RSS of this mode only in a fresh process), then repeat timed runs"
+    memory = BuildWings(filename, mode, memory=True)
+    times = [BuildWings(filename, mode) for i in range(repeat)]
+    return {'times': times, 'memory': memory}
+
+def FreeCADCmd():
+    "FreeCAD command line program next to the running FreeCAD, None if not found"
+    folder = os.path.dirname(sys.executable)
+    for name in ('FreeCADCmd', 'freecadcmd', 'FreeCADCmd.exe'):
+        candidate = os.path.join(folder, name)
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+resultTag = 'AderBench:'
+
+def RunIsolated(filename, mode, repeat=3):
+    "BuildWingsMode in a fresh FreeCADCmd process, None if FreeCADCmd is not found"
+    import json
+    import subprocess
+    import tempfile
+
+    exe = FreeCADCmd()
+    if exe is None:
+        return None
+    script = (f"import sys, os, json\n"
+              f"sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r})\n"
+              f"import adrBench\n"
+              f"print({resultTag!r} + json.dumps(adrBench.BuildWingsMode({filename!r}, {mode!r}, {repeat})))\n"
+              f"sys.stdout.flush()\n"
+              f"os._exit(0)\n")
+    with tempfile.NamedTemporaryFile('w', suffix='.py', delete=False) as f:
+        f.write(script)
+    try:
+        out = subprocess.run([exe, f.name], capture_output=True, text=True, timeout=1800).stdout
+    finally:
+        os.remove(f.name)
+    for line in out.splitlines():
+        if line.startswith(resultTag):
+            return json.loads(line[len(resultTag):])
+    raise RuntimeError(f"Benchmark process failed ({mode}) :\n{out[-2000:]}")
+
+def BenchBuildWings(filename=None, repeat=3, isolated=True):
+    """
+    wing and stabilizers build of an example document : without batch
+    build, batch build in one transaction, bulk build (no undo).
+    Each mode in a fresh FreeCADCmd process (isolated, if found), peak
+    RSS reset before the memory run where possible (Linux) : the peak
+    RSS growth is the one of this mode only.
+    Times : repeat runs without tracing. Memory : one separate run, RSS
+    growth with the document open (undo stack of FreeCAD/OCC included),
+    peak RSS growth, python peak (tracemalloc), undo steps recorded,
+    objects and sketches recomputed (batch build : each sketch once).
+    """
+    if filename is None:
+        filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'examples', 'F1776_spec.FCStd')
+    print(os.path.basename(filename))
+    result = {}
+    for mode in buildModes:
+        r = RunIsolated(filename, mode, repeat) if isolated else None
+        if r is None:
+            if not ResetPeakRss():
+                print(f"  {mode} : same process, peak RSS growth depends on the modes run before")
+            r = BuildWingsMode(filename, mode, repeat)
+        times, m = sorted(r['times']), r['memory']
+        print(f"  {mode:12s} : best {times[0]*1000:8.1f} ms, median {times[len(times)//2]*1000:8.1f} ms | "
+              f"RSS +{KB(m['rss'])}, peak RSS +{KB(m['maxRss'])} (process {KB(m['processPeak'])}), "
+              f"python peak {KB(m['peak'])}, {m['undos']:3d} undo steps, "
+              f"{m['recomputes']} recomputes ({m['sketchRecomputes']} sketches)")
+        result[mode] = r
+    return result
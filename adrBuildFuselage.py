@@ -11,6 +11,7 @@
 #*     - adrLibPart : pad generation                                           *
 #*                                                                             *
 #*  History :                                                                  *
+#*     2026-10-18 : batch build (one recompute, view fit)                      *
 #*     2025-03-06 : Initial release tested on FreeCAD 1.0.0                    *
 #*                                                                             *
 #*******************************************************************************
@@ -57,21 +58,19 @@ class CommandBuildFuselage:
         # sort frames
         frames = sorted(frames, key=lambda s: s.AttachmentOffset.Base.x)
 
-        # get/create fuselage body
-        bf=doc.getObject("Fuselage")
-        if bf == None:
-          bf=doc.addObject('PartDesign::Body','Fuselage')
-          bf.Label = wb.translate("Ader", "Fuselage")
+        # one recompute and view fit at the end
+        with wb.BatchBuild(doc, name=wb.translate("Ader","Build fuselage")):
+            # get/create fuselage body
+            bf=doc.getObject("Fuselage")
+            if bf == None:
+              bf=doc.addObject('PartDesign::Body','Fuselage')
+              bf.Label = wb.translate("Ader", "Fuselage")
 
-        # create loft
-        loft = bf.newObject('PartDesign::AdditiveLoft','FuselageLoft')
-        loft.Profile = frames[0]
-        for frame in frames[1:]:
-          loft.Sections += [(frame, [''])]
-
-        # display
-        App.ActiveDocument.recompute()
-        Gui.SendMsgToActiveView("ViewFit")
+            # create loft
+            loft = bf.newObject('PartDesign::AdditiveLoft','FuselageLoft')
+            loft.Profile = frames[0]
+            for frame in frames[1:]:
+              loft.Sections += [(frame, [''])]
 
 if App.GuiUp:
     #register the FreeCAD command
@@ -11,6 +11,8 @@
 #*     - adrLibPart : pad generation                                           *
 #*                                                                             *
 #*  History :                                                                  *
+#*     2026-10-18 : foils repaneled to foil_points (spec sheet), batch build,  *
+#*                  fit tolerance passed to the foil sketches                  *
 #*     2025-03-06 : Initial release tested on FreeCAD 1.0.0                    *
 #*                                                                             *
 #*******************************************************************************
@@ -52,7 +54,15 @@ class CommandBuildWings:
         spec = doc.getObject("specifications")
         if not spec:
             raise Exception(wb.translate("Ader", "No specification sheet"))
+        # one recompute and view fit at the end (sketches solved once)
+        with wb.BatchBuild(doc, name=wb.translate("Ader","Build wings")):
+            self.Build(doc, spec)
 
+    def Build(self, doc, spec, fit=None):
+        """
+        bodies, foil sketches and lofts of wing and stabilizers
+        fit : spline fit tolerance (mm, 0 : interpolation), None : Ader preferences
+        """
         # create bodies
         #   fuselage
         bf=doc.getObject("Fuselage")
@@ -77,17 +87,23 @@ class CommandBuildWings:
         s_z=spec.s_z*1000
         bs.Placement = App.Placement(App.Vector(s_x,0,s_z),App.Rotation(App.Vector(0,0,1),0))
 
+        # foils repaneled to the same point count (0 : file points)
+        try:
+            nbPoints=int(spec.foil_points)
+        except Exception:
+            nbPoints=0
+
         # create wing
         profile=spec.ci_profile
         chord=spec.ci*1000
         setting=spec.ci_cal
-        name, sk_in=adrFoil.MakeSketchFromDat(profile, chord, setting, skBody=bw)
+        name, sk_in=adrFoil.MakeSketchFromDat(profile, chord, setting, skBody=bw, nbPoints=nbPoints, fit=fit)
         profile=spec.ce_profile
         chord=spec.ce*1000
         setting=spec.ce_cal
         y = spec.b * 500    # b/2 in mm
-        name, sk_ext_right=adrFoil.MakeSketchFromDat(profile, chord, setting, sk_y=y, skBody=bw)
-        name, sk_ext_left=adrFoil.MakeSketchFromDat(profile, chord, setting, sk_y=-y, skBody=bw)
+        name, sk_ext_right=adrFoil.MakeSketchFromDat(profile, chord, setting, sk_y=y, skBody=bw, nbPoints=nbPoints, fit=fit)
+        name, sk_ext_left=adrFoil.MakeSketchFromDat(profile, chord, setting, sk_y=-y, skBody=bw, nbPoints=nbPoints, fit=fit)
         # loft the wing
         loft=bw.newObject('PartDesign::AdditiveLoft','lWing_r')
         loft.Profile = sk_in
@@ -105,10 +121,10 @@ class CommandBuildWings:
             pass
         if profile and profile != '': 
             chord=spec.vs_ci*1000
-            name, sk_in=adrFoil.MakeSketchFromDat(profile, chord, skBody=bs, plane= 'XY')
+            name, sk_in=adrFoil.MakeSketchFromDat(profile, chord, skBody=bs, plane= 'XY', nbPoints=nbPoints, fit=fit)
             chord=spec.vs_ce*1000
             y = spec.vs_length * 1000
-            name, sk_ext=adrFoil.MakeSketchFromDat(profile, chord, sk_y=y, skBody=bs, plane= 'XY')
+            name, sk_ext=adrFoil.MakeSketchFromDat(profile, chord, sk_y=y, skBody=bs, plane= 'XY', nbPoints=nbPoints, fit=fit)
             # loft the vertical stabilizer
             loft=bs.newObject('PartDesign::AdditiveLoft','lStab_v')
             loft.Profile = sk_in
@@ -118,15 +134,15 @@ class CommandBuildWings:
         if profile and profile != '': 
             chord=spec.hs_ci*1000
             dh = spec.hs_dh
-            name, sk_in_right=adrFoil.MakeSketchFromDat(profile, chord, dieth=dh, skBody=bs)
+            name, sk_in_right=adrFoil.MakeSketchFromDat(profile, chord, dieth=dh, skBody=bs, nbPoints=nbPoints, fit=fit)
             if dh == 0:
                 sk_in_left= sk_in_right
             else:
-                name, sk_in_left= adrFoil.MakeSketchFromDat(profile, chord, dieth=-dh, skBody=bs)
+                name, sk_in_left= adrFoil.MakeSketchFromDat(profile, chord, dieth=-dh, skBody=bs, nbPoints=nbPoints, fit=fit)
             chord=spec.hs_ce*1000
             y = spec.hs_length * 1000
-            name, sk_ext_right=adrFoil.MakeSketchFromDat(profile, chord, sk_y=y, dieth=dh, skBody=bs)
-            name, sk_ext_left=adrFoil.MakeSketchFromDat(profile, chord, sk_y=-y, dieth=-dh, skBody=bs)
+            name, sk_ext_right=adrFoil.MakeSketchFromDat(profile, chord, sk_y=y, dieth=dh, skBody=bs, nbPoints=nbPoints, fit=fit)
+            name, sk_ext_left=adrFoil.MakeSketchFromDat(profile, chord, sk_y=-y, dieth=-dh, skBody=bs, nbPoints=nbPoints, fit=fit)
             # loft the horizontal stabilizer
             loft=bs.newObject('PartDesign::AdditiveLoft','lStab_h_r')
             loft.Profile = sk_in_right
@@ -134,10 +150,6 @@ class CommandBuildWings:
             loft=bs.newObject('PartDesign::AdditiveLoft','lStab_h_l')
             loft.Profile = sk_in_left
             loft.Sections += [(sk_ext_left, ['Edge1',])]        
-       
-        # display
-        App.ActiveDocument.recompute()
-        Gui.SendMsgToActiveView("ViewFit")
 
 if App.GuiUp:
     #register the FreeCAD command
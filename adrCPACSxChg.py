@@ -9,6 +9,7 @@
 #*  Dependencies :                                                             *
 #*                                                                             *
 #*  History :                                                                  *
+#*    2026-10-18 : DatInCPACS : original strings, NACA designations            *
 #*    2023-07-15 : Initial release, tested on FreeCAD 0.20                     *
 #*                                                                             *
 #*******************************************************************************
@@ -146,8 +147,8 @@ def FuselageInCPACS(cpacs_file_path, fuselage_def):
     tree.write(cpacs_file_path, xml_declaration=True, encoding='utf-8', method="xml")
 
 def DatInCPACS(cpacs_file_path, dat_file_path):
-    # read .dat file
-    fname, fcoords = shapes.FoilCoordsFromDat(dat_file_path)
+    # read .dat file (original strings) or generate NACA designation
+    fname, fcoords = shapes.FoilCoordsFromDat(dat_file_path, originalFormat=True)
     fid= Path(dat_file_path).stem
 
     # Convert .dat lines to CPACS Vector type
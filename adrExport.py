@@ -56,11 +56,10 @@ def ExportProfiles():
     '''Export wing profiles from specifications'''
     doc = App.activeDocument()
     cpacs_file_path = doc.infos.cpacs_filename 
-    dat_base_path = os.path.join(wb.base_path, "dat_profiles") + "/"
-    dat_int = dat_base_path + doc.specifications.ci_profile  
+    dat_int = wb.DatFilePath(doc.specifications.ci_profile)
     toCPACS.DatInCPACS(cpacs_file_path, dat_int)
     if hasattr(doc.specifications, 'ce_profile'):
-        dat_ex = dat_base_path + doc.specifications.ce_profile
+        dat_ex = wb.DatFilePath(doc.specifications.ce_profile)
         # dat_ex = 'C:/Users/MINI PC/AppData/Roaming/FreeCAD/Mod/Ader/dat_profiles/n652-415.dat'
         if (dat_ex != dat_int):
             toCPACS.DatInCPACS(cpacs_file_path, dat_ex)
@@ -14,6 +14,11 @@
 #*     - adrLibPart : pad generation                                           *
 #*                                                                             *
 #*  History :                                                                  *
+#*     2026-10-18 : foil list with metrics, model based, loaded in background, *
+#*                  search, thumbnails, repaneling, Polyline coords,           *
+#*                  lean sketches, spline fit, batch build, search in a        *
+#*                  background thread, rows limited, background work stopped   *
+#*                  when the panel is closed                                   *
 #*     2025-03-04 : Initial release tested on FreeCAD 1.0.0                    *
 #*                                                                             *
 #*******************************************************************************
@@ -30,11 +35,19 @@ __url__ = ""
 import FreeCAD as App 
 import FreeCADGui as Gui
 import os
+import threading
 from math import pi, cos, sin, atan, radians
 from pathlib import Path
+from collections import OrderedDict
+from PySide import QtCore
+from PySide import QtGui
 from PySide import QtUiTools
 import adrLibShapes
 import adrLibPart
+import adrLibAnalysis
+import adrLibCatalog
+import adrLibThumbs
+import adrLibRepanel
 
 debugFoil= False
 
@@ -42,29 +55,201 @@ debugFoil= False
 import adrWBCommon as wb
 ui_file=  os.path.join(wb.resources_path, 'adrFoil.ui')
 icon_cmd= os.path.join(wb.icons_path,     'adrFoil.svg')
+# widgets not persisted (Ader.ini values are cast, a search "2412" would come back as int)
+transientWidgets= ('leFilter',)
 
 	
-def MakeSketchFromDat(datFile, length, setting=0, sk_y=0, dieth=0, skBody=None, plane='XZ'):
-    filename=os.path.join(wb.dat_path, datFile)
-    if Path(filename).suffix == '':
-        filename += '.dat'
-    name, coords= adrLibShapes.FoilCoordsFromDat(filename, length, setting)
+def MakeSketchFromDat(datFile, length, setting=0, sk_y=0, dieth=0, skBody=None, plane='XZ',
+                      nbPoints=0, spacing=adrLibRepanel.spacingCosine, lean=None, fit=None):
+    """
+    foil sketch, nbPoints > 0 : foil repaneled to nbPoints (0 : file points)
+    lean : B-spline only, fit : fit tolerance (mm, 0 : interpolation),
+    None : Ader preferences
+    """
+    filename=wb.DatFilePath(datFile)
+    name, coords= adrLibShapes.FoilPolylineFromDat(filename, length, setting, nbPoints=nbPoints, spacing=spacing)
     name.replace(" ", "_")
-    # make spline
-    vects = []
-    for coord in coords:
-        vects.append(App.Vector(coord))
-    if coords[0] != coords[-1]:   # close the wire
-        vects.append(App.Vector(coords[0]))
-    sk=adrLibPart.MakeSpline(vects, 'sk'+name, plane, body=skBody)
+    # make spline, closed wire
+    # leading edge interpolated when fitted
+    le=int(coords.xyz[:, 0].argmin())
+    sk=adrLibPart.MakeSpline(coords.Close(), 'sk'+name, plane, body=skBody, lean=lean, fit=fit, fixed=[le])
     # set y position
     y=sk_y*sin(radians(dieth))
     z=sk_y*cos(radians(dieth))
     sk.AttachmentOffset = App.Placement(App.Vector(0,y,z), App.Rotation(App.Vector(1,0,0), -dieth))  
     return name, sk
 
+def SketchCoords(sk, nbPoints=200):
+    "points (sketch coordinates) of the first B-spline of a foil sketch"
+    for geo in sk.Geometry:
+        if geo.TypeId == 'Part::GeomBSplineCurve':
+            return [(v.x, v.y) for v in geo.discretize(nbPoints)]
+    raise ValueError(wb.translate("Ader", "No spline in sketch"))
+
+def SimilarFoils(profile, k=10):
+    "k library foils most similar to a dat file name or a foil sketch"
+    if not isinstance(profile, str):
+        profile= SketchCoords(profile)
+    return wb.SimilarFoils(profile, k)
+
+class FoilListModel(QtCore.QAbstractTableModel):
+    """
+    catalog foils (file, title, metrics), rows filled at once when loaded.
+    Texts and sort values are formatted in SetRows : data() is called
+    for every visible cell and every sort comparison.
+    Thumbnails are requested when first displayed, kept in memory (LRU).
+    """
+    displayRole = QtCore.Qt.DisplayRole
+    sortRole = QtCore.Qt.UserRole
+    decorationRole = QtCore.Qt.DecorationRole
+    maxThumbs = 2000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.metrics = adrLibAnalysis.metrics
+        self.headers = [wb.translate("Ader", "File"), wb.translate("Ader", "Title")] + [m[1] for m in self.metrics]
+        self.entries = []
+        self.texts = []     # per row, display texts
+        self.values = []    # per row, sort values
+        self.paths = []     # per row, full path
+        self.rowOfPath = {}
+        self.thumbs = OrderedDict()     # full path -> QPixmap
+        self.thumbLoader = adrLibThumbs.ThumbLoader(wb.GetThumbCache(), self)
+        self.thumbLoader.ready.connect(self.OnThumbReady)
+
+    def SetRows(self, rows):
+        "rows : (catalog entry, metrics dict)"
+        entries, texts, values = [], [], []
+        for entry, r in rows:
+            t = [entry['file'], entry['title']]
+            v = [entry['file'].lower(), entry['title'].lower()]
+            for key, title, fmt in self.metrics:
+                value = r.get(key)
+                t.append(None if value is None else fmt.format(value))
+                v.append(value)
+            entries.append(entry)
+            texts.append(t)
+            values.append(v)
+        paths = [os.path.join(e['folder'], e['file']) for e in entries]
+        self.thumbLoader.Clear()
+        self.beginResetModel()
+        self.entries, self.texts, self.values, self.paths = entries, texts, values, paths
+        self.rowOfPath = {p: row for row, p in enumerate(paths)}
+        self.endResetModel()
+
+    def Entry(self, row):
+        return self.entries[row]
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.entries)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == self.displayRole:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role == self.displayRole:
+            return self.texts[index.row()][index.column()]
+        if role == self.sortRole:
+            return self.values[index.row()][index.column()]
+        if role == self.decorationRole and index.column() == 0:
+            return self.Thumb(self.paths[index.row()])
+        return None
+
+    def Thumb(self, path):
+        "thumbnail pixmap, None while loading or if the file can't be drawn"
+        pixmap = self.thumbs.get(path)
+        if pixmap is None:
+            self.thumbLoader.Request(path)
+            return None
+        self.thumbs.move_to_end(path)
+        return None if pixmap.isNull() else pixmap
+
+    def OnThumbReady(self, path, image):
+        # QPixmap in the GUI thread only
+        self.thumbs[path] = QtGui.QPixmap.fromImage(image)
+        while len(self.thumbs) > self.maxThumbs:
+            self.thumbs.popitem(last=False)
+        row = self.rowOfPath.get(path)
+        if row is not None:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index, [self.decorationRole])
+
+class FoilListLoader(QtCore.QObject):
+    "refresh catalog and metrics in a background thread, results through signals"
+    progress = QtCore.Signal(int, int)
+    loaded = QtCore.Signal(object)
+
+    def Rows(self):
+        "rows from the catalog as it is, no file read"
+        catalog = wb.GetFoilCatalog(refresh=False)
+        analysis = wb.GetFoilAnalysis()
+        return [(e, analysis.Get(e) or {}) for e in catalog.Entries(status=adrLibCatalog.statusOk)]
+
+    def Start(self):
+        self.thread = threading.Thread(target=self.Run, name="AderFoilList", daemon=True)
+        self.thread.start()
+
+    def Run(self):
+        try:
+            wb.GetFoilCatalog(refresh=True, progress=self.progress.emit)
+            wb.GetFoilAnalysis(update=True, progress=self.progress.emit)
+            wb.GetFoilSearch(update=True)
+        except Exception as e:
+            # list as it is, progress bar hidden
+            wb.consoleMsg(wb.translate("Ader", "Foil list refresh failed : ") + f"{e}\n")
+        self.loaded.emit(self.Rows())
+
+class FoilSearcher(QtCore.QObject):
+    """
+    foil searches in a background thread, only the last text is searched,
+    results (limit + 1 rows at most) through a signal
+    """
+    found = QtCore.Signal(str, object)
+
+    def __init__(self, limit, parent=None):
+        super().__init__(parent)
+        self.limit = limit
+        self.pending = None
+        self.stopped = False
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def Search(self, text):
+        with self.condition:
+            self.pending = text
+            self.condition.notify()
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.Run, name="AderFoilSearch", daemon=True)
+            self.thread.start()
+
+    def Stop(self):
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+
+    def Run(self):
+        while True:
+            with self.condition:
+                while self.pending is None and not self.stopped:
+                    self.condition.wait()
+                if self.stopped:
+                    return
+                text, self.pending = self.pending, None
+            try:
+                rows = wb.SearchFoils(text, limit=self.limit + 1)
+            except Exception as e:
+                wb.debugMsg(f"Foil search : {e}\n", False)
+                continue
+            self.found.emit(text, rows)
+
 class CommandFoil:
     "the Foil command definition"
+    maxRows = 1000      # rows listed, the search is refined beyond
 
     def GetResources(self):
         return {'Pixmap': icon_cmd, 
@@ -78,34 +263,148 @@ class CommandFoil:
         wb.InTaskPanel(self, ui_file)
  
     def LocalInitTaskValues(self):
-        "initialize TaskPanel values"
-        # dat profiles
-        files, profiles= wb.ListDatProfiles()
-        # sort files associated to profiles
-        paired = sorted(zip(files, profiles), key=lambda t: t[0].lower())
-        if paired:
-            files, profiles = map(list, zip(*paired))
+        "initialize TaskPanel values, foil list filled in background"
+        self.panelOpen= True
+        self.model= FoilListModel()
+        self.proxy= QtCore.QSortFilterProxyModel()
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setSortRole(QtCore.Qt.UserRole)
+        tv= self.form.tvDat
+        tv.setModel(self.proxy)
+        tv.setIconSize(QtCore.QSize(adrLibThumbs.thumbWidth, adrLibThumbs.thumbHeight))
+        tv.header().resizeSection(0, adrLibThumbs.thumbWidth + 100)
+        tv.sortByColumn(0, QtCore.Qt.AscendingOrder)
+        self.datFile= str(wb.GetValue(self.form.objectName(), 'datFile', ''))
+        self.rows= []
+
+        # search as you type, query when typing pauses
+        self.filterTimer= QtCore.QTimer()
+        self.filterTimer.setSingleShot(True)
+        self.filterTimer.setInterval(150)
+        self.filterTimer.timeout.connect(self.OnFilter)
+        self.form.leFilter.textChanged.connect(self.filterTimer.start)
+        self.searcher= FoilSearcher(self.maxRows)
+        self.searcher.found.connect(self.OnFound)
+
+        # known foils first (index file or prewarmed catalog), then refresh
+        self.loader= FoilListLoader()
+        self.loader.progress.connect(self.OnLoadProgress)
+        self.loader.loaded.connect(self.OnLoaded)
+        self.OnLoaded(self.loader.Rows(), final=False)
+        self.form.pbDat.setVisible(True)
+        self.loader.Start()
+        wb.InitFormValues(self.form, skip=transientWidgets)
+        return True
+
+    def ClosePanel(self):
+        "background work of the panel stopped, its signals disconnected (the form is deleted)"
+        self.panelOpen= False
+        self.filterTimer.stop()
+        for signal, slot in ((self.loader.progress, self.OnLoadProgress), (self.loader.loaded, self.OnLoaded),
+                             (self.searcher.found, self.OnFound)):
+            try:
+                signal.disconnect(slot)
+            except (RuntimeError, TypeError):
+                pass
+        self.searcher.Stop()
+        self.model.thumbLoader.Clear()
+
+    def OnLoadProgress(self, done, total):
+        if not self.panelOpen:
+            return
+        self.form.pbDat.setMaximum(total)
+        self.form.pbDat.setValue(done)
+
+    def OnLoaded(self, rows, final=True):
+        if not self.panelOpen:
+            return
+        self.rows= rows
+        if self.form.leFilter.text().strip():
+            self.OnFilter()
         else:
-            files, profiles = [], []
-        
-        self.form.cbDat.clear()
-        self.form.cbDat.addItems(files)
-        return False
+            self.ShowAll()
+        if final:
+            self.form.pbDat.setVisible(False)
+
+    def OnFilter(self):
+        "rows matching the filter text (words and ranges, see adrLibSearch.ParseQuery)"
+        if not self.panelOpen:
+            return
+        text= self.form.leFilter.text().strip()
+        if not text:
+            self.ShowAll()
+            return
+        self.searcher.Search(text)
+
+    def OnFound(self, text, found):
+        if not self.panelOpen:
+            return
+        if text != self.form.leFilter.text().strip():
+            return      # outdated
+        self.ShowRows([(r, r) for r in found[:self.maxRows]], len(found) > self.maxRows)
+
+    def ShowAll(self):
+        "first catalog foils, the selected one included"
+        rows= self.rows[:self.maxRows]
+        current= (self.SelectedFile() or self.datFile).lower()
+        if len(self.rows) > self.maxRows and current and not any(e['file'].lower() == current for e, r in rows):
+            rows += [(e, r) for e, r in self.rows[self.maxRows:] if e['file'].lower() == current]
+        self.ShowRows(rows, len(self.rows) > self.maxRows)
+
+    def ShowRows(self, rows, more=False):
+        "fill the list, selection kept, more : rows left out"
+        current= self.SelectedFile() or self.datFile
+        self.model.SetRows(rows)
+        if more:
+            self.form.lProfil.setText(wb.translate("Ader", "Dat file : first {} foils, refine the search").format(self.maxRows))
+        else:
+            self.form.lProfil.setText(wb.translate("Ader", "Dat file :"))
+        if current:
+            for row, (entry, r) in enumerate(rows):
+                if entry['file'].lower() == current.lower():
+                    index= self.proxy.mapFromSource(self.model.index(row, 0))
+                    self.form.tvDat.setCurrentIndex(index)
+                    self.form.tvDat.scrollTo(index)
+                    break
+
+    def SelectedFile(self):
+        "file name of the selected foil, None if no selection"
+        index= self.form.tvDat.currentIndex()
+        if not index.isValid():
+            return None
+        return self.model.Entry(self.proxy.mapToSource(index).row())['file']
+
+    def LocalSaveTaskValues(self):
+        "save selected foil and form values, search text not kept"
+        datFile= self.SelectedFile()
+        if datFile:
+            wb.SaveValue(self.form.objectName(), 'datFile', datFile)
+        wb.SaveFormValues(self.form, skip=transientWidgets)
+        return True
 
     def accept(self):
-        datFile=self.form.cbDat.currentText()
+        datFile=self.SelectedFile()
+        if datFile is None:
+            raise Exception(wb.translate("Ader", "No foil selected"))
         length = self.form.sbChord.value()
         setting = self.form.sbSetting.value()
         y=self.form.sby.value()
-        # make sketch
-        name, sk= MakeSketchFromDat(datFile, length, setting, y) 
-        # make pad
-        if self.form.rbPad.isChecked():
-            length=self.form.sbPadLength.value()
-            adrLibPart.MakePad(sk, length, 'p'+name, midplane=1)
+        nbPoints=self.form.sbPoints.value()
+        spacing=adrLibRepanel.spacings[self.form.cbSpacing.currentIndex()]
+        with wb.BatchBuild(name=wb.translate("Ader","Foil")):
+            # make sketch
+            name, sk= MakeSketchFromDat(datFile, length, setting, y, nbPoints=nbPoints, spacing=spacing) 
+            # make pad
+            if self.form.rbPad.isChecked():
+                length=self.form.sbPadLength.value()
+                adrLibPart.MakePad(sk, length, 'p'+name, midplane=1)
     
+        self.ClosePanel()
         wb.TaskTerminated(self)
-        App.ActiveDocument.recompute()
+
+    def reject(self):
+        self.ClosePanel()
+        Gui.Control.closeDialog()
 
 
 if App.GuiUp:
@@ -11,6 +11,7 @@
 #*     - adrLibShapes : frame generation                                        *
 #*                                                                             *
 #*  History :                                                                  *
+#*     2026-10-18 : batch build (one recompute, view fit)                      *
 #*     2025-03-12 : Initial release tested on FreeCAD 1.0.0                    *
 #*                                                                             *
 #*******************************************************************************
@@ -66,10 +67,10 @@ class CommandFrame:
         elif self.form.rb16.isChecked(): 
             nb=16
         constrained=self.form.ckConstrained.isChecked()
-        sk= adrLibShapes.MakeFrame(height, width, offset, x, fixedFrame=constrained, nbPoints=nb) 
+        with wb.BatchBuild(name=wb.translate("Ader","Frame")):
+            sk= adrLibShapes.MakeFrame(height, width, offset, x, fixedFrame=constrained, nbPoints=nb) 
 
         wb.TaskTerminated(self)
-        App.ActiveDocument.recompute()
 
 
 if App.GuiUp:
@@ -10,6 +10,7 @@
 #*     - adrLibShapesrt : frames generation                                    *
 #*                                                                             *
 #*  History :                                                                  *
+#*     2026-10-18 : batch build (one recompute, view fit)                      *
 #*     2025-09-19 : Initial release tested on FreeCAD 1.0.2                    *
 #*                                                                             *
 #*******************************************************************************
@@ -61,9 +62,9 @@ class CommandFrames:
         elif self.form.rb16.isChecked(): 
             nb=16
         # make Frames
-        adrLibShapes.MakeFramesFromPlanes()
+        with wb.BatchBuild(name=wb.translate("Ader","Frames")):
+            adrLibShapes.MakeFramesFromPlanes()
         wb.TaskTerminated(self)
-        App.ActiveDocument.recompute()
 
 
 if App.GuiUp:
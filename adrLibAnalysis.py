@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+# *******************************************************************************
+# *  Ader workbench                                                             *
+# *    For more details see InitGui.py and the LICENCE text file.               *
+# *                                                                             *
+# *  Module : adrLibAnalysis.py                                                 *
+# *    Geometric characterization of the foil library                           *
+# *     - max thickness and position, max camber and position, LE radius,       *
+# *       TE thickness, point count (relative to chord)                         *
+# *     - batch computation on a process pool, only for changed files           *
+# *     - results persisted next to the catalog                                 *
+# *                                                                             *
+# *  Dependencies :                                                             *
+# *    numpy, adrLibDat (no FreeCAD import, usable in worker processes)         *
+# *                                                                             *
+# *  History :                                                                  *
+# *    2026-10-18 : initial release                                             *
+# *    2026-10-18 : thread fallback at pool start up only, any failure on a     *
+# *                 foil is an error status                                     *
+# *                                                                             *
+# *******************************************************************************
+
+__title__ = "Ader Workbench - foil analysis"
+__author__ = "Claude GUTH"
+
+import os
+import sys
+import json
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
+import adrLibDat
+
+# results file format version, increase to force a full recomputation
+analysisVersion = 2
+
+# metrics : key, column title, format
+metrics = [
+    ('thickness',   't max',   '{:.2%}'),
+    ('xThickness',  'x t max', '{:.1%}'),
+    ('camber',      'f max',   '{:.2%}'),
+    ('xCamber',     'x f max', '{:.1%}'),
+    ('leRadius',    'r LE',    '{:.2%}'),
+    ('teThickness', 't TE',    '{:.2%}'),
+    ('points',      'points',  '{:d}'),
+]
+
+# stations (cosine spacing) used to compare upper and lower sides
+nbStations = 201
+
+def SplitSides(coords):
+    "upper and lower sides from leading edge to trailing edge, Selig order coords"
+    ile = int(np.argmin(coords[:, 0]))
+    upper = coords[ile::-1]
+    lower = coords[ile:]
+    # lower side is the one with the smaller mean y
+    if len(upper) > 1 and len(lower) > 1 and upper[:, 1].mean() < lower[:, 1].mean():
+        upper, lower = lower, upper
+    return upper, lower
+
+def SideAt(side, x):
+    "y of a side (LE to TE) at stations x, side x made monotonic"
+    xs = np.maximum.accumulate(side[:, 0])
+    return np.interp(x, xs, side[:, 1])
+
+def LeadingEdgeRadius(coords, ile):
+    "least squares circle (Kasa) through the points near the leading edge"
+    n = len(coords)
+    for half in (3, 4, 5, 2):
+        lo, hi = max(ile - half, 0), min(ile + half + 1, n)
+        pts = coords[lo:hi]
+        if len(pts) < 3:
+            continue
+        a = np.column_stack((2*pts[:, 0], 2*pts[:, 1], np.ones(len(pts))))
+        b = (pts**2).sum(axis=1)
+        try:
+            (xc, yc, c), res, rank, sv = np.linalg.lstsq(a, b, rcond=None)
+        except np.linalg.LinAlgError:
+            continue
+        if rank < 3:
+            continue
+        r2 = c + xc*xc + yc*yc
+        if r2 > 0:
+            return float(np.sqrt(r2))
+    return 0.0
+
+def AnalyzeCoords(coords):
+    "metrics of a foil, coords (N, 2) in Selig order, results relative to chord"
+    coords = np.asarray(coords, dtype=np.float64)
+    xMin = coords[:, 0].min()
+    chord = coords[:, 0].max() - xMin
+    if chord <= 0:
+        raise ValueError("Null chord")
+    unit = (coords - (xMin, 0.0)) / chord
+    upper, lower = SplitSides(unit)
+    x = 0.5*(1 - np.cos(np.linspace(0, np.pi, nbStations)))
+    yu = SideAt(upper, x)
+    yl = SideAt(lower, x)
+    t = yu - yl
+    f = 0.5*(yu + yl)
+    it = int(np.argmax(t))
+    ic = int(np.argmax(np.abs(f)))
+    return {
+        'thickness':   float(t[it]),
+        'xThickness':  float(x[it]),
+        'camber':      float(f[ic]),
+        'xCamber':     float(x[ic]),
+        'leRadius':    LeadingEdgeRadius(unit, int(np.argmin(unit[:, 0]))),
+        'teThickness': float(np.hypot(*(unit[0] - unit[-1]))),
+        'points':      len(coords),
+    }
+
+def AnalyzeFile(filename):
+    "metrics of a foil file, 'status' is 'ok' or 'error'"
+    try:
+        title, coords = adrLibDat.ReadDat(filename)
+        result = AnalyzeCoords(coords)
+    except Exception:
+        # any failure on one foil : that foil only is in error
+        return {'status': 'error'}
+    result['status'] = 'ok'
+    return result
+
+def PythonExecutable():
+    """
+    Python interpreter for worker processes : in FreeCAD sys.executable is
+    the FreeCAD program, look for the bundled python next to it.
+    """
+    exe = sys.executable
+    if os.path.basename(exe).lower().startswith('python'):
+        return exe
+    folder = os.path.dirname(exe)
+    for name in ('python.exe', 'python3', 'python'):
+        candidate = os.path.join(folder, name)
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+def NewPool(workers=None):
+    "process pool when a python interpreter is available, thread pool otherwise"
+    exe = PythonExecutable()
+    if exe is None:
+        return ThreadPoolExecutor(max_workers=workers)
+    ctx = multiprocessing.get_context('spawn')
+    ctx.set_executable(exe)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+
+def StartPool(workers=None):
+    """
+    process pool, a probe task run : thread pool if processes can't be
+    started (frozen / embedded interpreter)
+    """
+    try:
+        pool = NewPool(workers)
+    except (OSError, RuntimeError):
+        return ThreadPoolExecutor(max_workers=workers)
+    if isinstance(pool, ProcessPoolExecutor):
+        try:
+            pool.submit(os.getpid).result()
+        except (OSError, RuntimeError, BrokenProcessPool):
+            pool.shutdown(wait=False)
+            return ThreadPoolExecutor(max_workers=workers)
+    return pool
+
+def PoolMap(func, items, workers=None, progress=None):
+    """
+    [func(item) for item in items] on a process pool (thread pool if
+    processes can't be started), progress(done, total) called on the way.
+    func must be a module level function of a FreeCAD free module.
+    Failures once the pool is started are raised.
+    """
+    results = []
+    if len(items) > 1:
+        with StartPool(workers) as pool:
+            for r in pool.map(func, items, chunksize=32):
+                results.append(r)
+                if progress and len(results) % 50 == 0:
+                    progress(len(results), len(items))
+    else:
+        results = [func(item) for item in items]
+    if progress:
+        progress(len(items), len(items))
+    return results
+
+
+class FoilAnalysis:
+    """
+    Metrics of the catalog foils, persisted in a json file.
+    Results are keyed by full path and valid while size and mtime don't change.
+    """
+
+    def __init__(self, resultsFile=None):
+        self.resultsFile = resultsFile
+        self.results = {}
+        self.lock = threading.Lock()
+        self.Load()
+
+    def Load(self):
+        if not self.resultsFile or not os.path.exists(self.resultsFile):
+            return False
+        try:
+            with open(self.resultsFile, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get('version') != analysisVersion:
+            return False
+        with self.lock:
+            self.results = data.get('results', {})
+        return True
+
+    def Save(self):
+        if not self.resultsFile:
+            return False
+        with self.lock:
+            data = {'version': analysisVersion, 'results': self.results}
+        tmpFile = self.resultsFile + '.tmp'
+        try:
+            with open(tmpFile, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmpFile, self.resultsFile)
+        except OSError:
+            return False
+        return True
+
+    def Key(self, entry):
+        return os.path.join(entry['folder'], entry['file'])
+
+    def Get(self, entry):
+        "metrics of a catalog entry, None if not computed or outdated"
+        with self.lock:
+            r = self.results.get(self.Key(entry))
+        if r is None or r['size'] != entry['size'] or r['mtime'] != entry['mtime']:
+            return None
+        return r
+
+    def Update(self, entries, workers=None, save=True, progress=None):
+        """
+        Compute metrics of new or changed catalog entries on a process pool,
+        drop results of entries no longer in the catalog.
+        Returns the number of foils computed.
+        progress(done, total) is called while foils are computed.
+        """
+        todo = [e for e in entries if self.Get(e) is None]
+        computed = PoolMap(AnalyzeFile, [self.Key(e) for e in todo], workers, progress)
+        keys = set(self.Key(e) for e in entries)
+        with self.lock:
+            results = {k: r for k, r in self.results.items() if k in keys}
+            for e, r in zip(todo, computed):
+                r['size'] = e['size']
+                r['mtime'] = e['mtime']
+                results[self.Key(e)] = r
+            changed = len(todo) > 0 or len(results) != len(self.results)
+            self.results = results
+        if save and changed:
+            self.Save()
+        return len(todo)
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# *******************************************************************************
+# *  Ader workbench                                                             *
+# *    For more details see InitGui.py and the LICENCE text file.               *
+# *                                                                             *
+# *  Module : adrLibCatalog.py                                                  *
+# *    Airfoil catalog : persistent index of the foil files                     *
+# *     - file name, title, dialect, size, mtime, point count, status           *
+# *     - incremental refresh : only new or modified files are read             *
+# *     - first build in parallel                                               *
+# *                                                                             *
+# *  Dependencies :                                                             *
+# *    adrLibDat (no FreeCAD import, usable outside the workbench)              *
+# *                                                                             *
+# *  History :                                                                  *
+# *    2026-10-18 : initial release                                             *
+# *                                                                             *
+# *******************************************************************************
+
+__title__ = "Ader Workbench - airfoil catalog"
+__author__ = "Claude GUTH"
+
+import os
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import adrLibDat
+
+# index file format version, increase to force a full rebuild
+catalogVersion = 3
+
+# foil file extensions handled by the catalog
+datExtensions = ('.dat', '.cor', '.txt')
+
+# parse status
+statusOk = 'ok'
+statusError = 'error'
+
+def ReadFoilInfos(filename):
+    """
+    Read title, dialect and point count of a foil file.
+    Returns a dict with 'title', 'dialect', 'points' and 'status'.
+    """
+    return adrLibDat.ReadDatInfos(filename)
+
+
+class FoilCatalog:
+    """
+    Index of the foil files found in a list of folders.
+
+    Entries are dicts : file, folder, title, dialect, size, mtime, points, status.
+    A file name found in several folders is taken from the first folder.
+    """
+
+    def __init__(self, folders, indexFile=None, workers=8):
+        self.folders = [f for f in folders if f]
+        self.indexFile = indexFile
+        self.workers = workers
+        self.entries = {}          # file name (lower case) -> entry
+        self.lock = threading.Lock()
+        self.Load()
+
+    def Load(self):
+        "load index file, ignored if missing, invalid or from an other version"
+        if not self.indexFile or not os.path.exists(self.indexFile):
+            return False
+        try:
+            with open(self.indexFile, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get('version') != catalogVersion:
+            return False
+        with self.lock:
+            self.entries = {e['file'].lower(): e for e in data.get('entries', [])}
+        return True
+
+    def Save(self):
+        "write index file"
+        if not self.indexFile:
+            return False
+        with self.lock:
+            data = {'version': catalogVersion, 'entries': list(self.entries.values())}
+        tmpFile = self.indexFile + '.tmp'
+        try:
+            with open(tmpFile, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmpFile, self.indexFile)
+        except OSError:
+            return False
+        return True
+
+    def Scan(self):
+        "list foil files of the folders with their size and mtime (no file opened)"
+        found = {}
+        for folder in self.folders:
+            try:
+                it = os.scandir(folder)
+            except OSError:
+                continue
+            with it:
+                for de in it:
+                    if not de.name.lower().endswith(datExtensions):
+                        continue
+                    key = de.name.lower()
+                    if key in found or not de.is_file():
+                        continue
+                    st = de.stat()
+                    found[key] = {'file': de.name, 'folder': folder,
+                                  'size': st.st_size, 'mtime': st.st_mtime}
+        return found
+
+    def Refresh(self, save=True, progress=None):
+        """
+        Update the index : new or modified (mtime, size) files are read,
+        removed files are dropped. Returns the number of files read.
+        progress(done, total) is called while files are read.
+        """
+        found = self.Scan()
+        with self.lock:
+            old = self.entries
+        todo = []
+        entries = {}
+        for key, st in found.items():
+            e = old.get(key)
+            if e and e['folder'] == st['folder'] and e['size'] == st['size'] and e['mtime'] == st['mtime']:
+                entries[key] = e
+            else:
+                todo.append((key, st))
+
+        def read(item):
+            key, st = item
+            e = dict(st)
+            e.update(ReadFoilInfos(os.path.join(st['folder'], st['file'])))
+            return key, e
+
+        results = []
+        if len(todo) > 1 and self.workers > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for result in pool.map(read, todo):
+                    results.append(result)
+                    if progress and len(results) % 50 == 0:
+                        progress(len(results), len(todo))
+        else:
+            results = [read(item) for item in todo]
+        if progress:
+            progress(len(todo), len(todo))
+        entries.update(results)
+
+        with self.lock:
+            changed = len(todo) > 0 or len(entries) != len(self.entries)
+            self.entries = entries
+        if save and changed:
+            self.Save()
+        return len(todo)
+
+    # queries
+
+    def Entries(self, status=None):
+        "entries sorted by file name, optionally filtered by status"
+        with self.lock:
+            entries = list(self.entries.values())
+        if status:
+            entries = [e for e in entries if e['status'] == status]
+        return sorted(entries, key=lambda e: e['file'].lower())
+
+    def Query(self, predicate):
+        "entries (sorted by file name) for which predicate(entry) is True"
+        return [e for e in self.Entries() if predicate(e)]
+
+    def Find(self, name):
+        "entry for a file name, extension optional (.dat first), None if unknown"
+        key = name.lower()
+        with self.lock:
+            e = self.entries.get(key)
+            if e is None and os.path.splitext(key)[1] == '':
+                for ext in datExtensions:
+                    e = self.entries.get(key + ext)
+                    if e:
+                        break
+        return e
+
+    def Path(self, name):
+        "full path of a foil file, None if unknown"
+        e = self.Find(name)
+        if e is None:
+            return None
+        return os.path.join(e['folder'], e['file'])
+
+    def __len__(self):
+        return len(self.entries)
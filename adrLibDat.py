@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+# *******************************************************************************
+# *  Ader workbench                                                             *
+# *    For more details see InitGui.py and the LICENCE text file.               *
+# *                                                                             *
+# *  Module : adrLibDat.py                                                      *
+# *    Airfoil files reader                                                     *
+# *     - dialects : Selig, Lednicer (point counts header), headerless (.cor),  *
+# *       comma separated                                                       *
+# *     - numeric block parsed in one bulk pass with numpy                      *
+# *     - coords returned as a contiguous (N, 2) array, Selig order :           *
+# *       TE > upper side > LE > lower side > TE                                 *
+# *     - or the original x, y strings of the same rows (CPACS export)          *
+# *                                                                             *
+# *  Dependencies :                                                             *
+# *    numpy (no FreeCAD import, usable outside the workbench)                  *
+# *                                                                             *
+# *  History :                                                                  *
+# *    2026-10-18 : initial release                                             *
+# *    2026-10-18 : column count checked for the bulk pass, non finite values   *
+# *                 rejected                                                    *
+# *    2026-10-18 : original strings (replaces the adrLibGeom regex reader)     *
+# *                                                                             *
+# *******************************************************************************
+
+__title__ = "Ader Workbench - airfoil files reader"
+__author__ = "Claude GUTH"
+
+import os
+import numpy as np
+
+# dialects
+dialectSelig = 'selig'
+dialectLednicer = 'lednicer'
+dialectHeaderless = 'headerless'
+dialectCsv = 'csv'
+
+# a jump in x larger than this (unit chord) starts a new side
+sideJump = 0.5
+
+def DecodeText(raw):
+    "bytes to text, utf-8 or latin-1"
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return raw.decode('latin-1')
+
+def ReadText(filename):
+    "file text, utf-8 or latin-1"
+    with open(filename, 'rb') as f:
+        return DecodeText(f.read())
+
+def IsNumericLine(line):
+    "True if line holds at least two numbers (x, y)"
+    tokens = line.replace(',', ' ').split()
+    if len(tokens) < 2:
+        return False
+    try:
+        float(tokens[0])
+        float(tokens[1])
+    except ValueError:
+        return False
+    return True
+
+def SliceNumericBlock(lines, start):
+    "first and last+1 index of the numeric block starting at or after start"
+    first = start
+    while first < len(lines) and not IsNumericLine(lines[first]):
+        first += 1
+    last = len(lines)
+    while last > first and not IsNumericLine(lines[last - 1]):
+        last -= 1
+    return first, last
+
+def ParseBlock(lines, strings=False):
+    """
+    (N, 2) array (x, y : first 2 columns) from numeric lines, bulk
+    conversion when all lines have the column count of the first one,
+    per line fallback. Raises ValueError on non finite values.
+    strings : (N, 2) array of the original x, y strings returned too.
+    """
+    coords = tokens = None
+    columns = len(lines[0].replace(',', ' ').split()) if lines else 0
+    try:
+        words = ' '.join(lines).replace(',', ' ').split()
+        values = np.array(words, dtype=np.float64)
+        if columns >= 2 and len(values) == columns*len(lines) \
+                and len(lines[-1].replace(',', ' ').split()) == columns:
+            coords = values.reshape(-1, columns)[:, :2]
+            if strings:
+                tokens = np.array(words, dtype=str).reshape(-1, columns)[:, :2]
+    except ValueError:
+        pass
+    if coords is None:
+        # slow path : blank, comment lines or column counts differing in the block
+        rows = []
+        for line in lines:
+            if IsNumericLine(line):
+                rows.append(line.replace(',', ' ').split()[:2])
+        coords = np.array([(float(x), float(y)) for x, y in rows], dtype=np.float64).reshape(-1, 2)
+        if strings:
+            tokens = np.array(rows, dtype=str).reshape(-1, 2)
+    if not np.isfinite(coords).all():
+        raise ValueError("Non finite coordinates")
+    if strings:
+        return np.ascontiguousarray(coords), tokens
+    return np.ascontiguousarray(coords)
+
+def SidesOrder(first, second):
+    """
+    Row order joining 2 sides in Selig order (rows of first then second).
+    first starts at trailing edge (Selig split : upper TE>LE, lower TE>LE)
+    or at leading edge (Lednicer : upper LE>TE, lower LE>TE).
+    """
+    rowsFirst = np.arange(len(first))
+    rowsSecond = np.arange(len(first), len(first) + len(second))
+    if first[0, 0] > first[-1, 0]:
+        upper, lower = rowsFirst, rowsSecond[::-1]
+        lowerStart = second[-1]
+    else:
+        upper, lower = rowsFirst[::-1], rowsSecond
+        lowerStart = second[0] if len(second) else None
+    if len(lower) and np.array_equal(lowerStart, first[upper[-1]]):
+        lower = lower[1:]
+    return np.concatenate((upper, lower))
+
+def JoinSides(first, second):
+    "Join 2 sides in Selig order (see SidesOrder)"
+    return np.concatenate((first, second))[SidesOrder(first, second)]
+
+def ParseDatText(text, name='', strings=False):
+    """
+    Parse an airfoil file text.
+    Returns title, coords (contiguous (N, 2) float64, Selig order) and dialect,
+    strings : and the original x, y strings of the same rows (list of pairs).
+    name : title for headerless files.
+    Raises ValueError if less than 3 points are found.
+    """
+    lines = text.splitlines()
+    if lines and IsNumericLine(lines[0]):
+        title = name
+        dialect = dialectHeaderless
+        start = 0
+    else:
+        title = lines[0].strip() if lines else ''
+        dialect = dialectSelig
+        start = 1
+    first, last = SliceNumericBlock(lines, start)
+    if dialect == dialectSelig and any(',' in line for line in lines[first:min(last, first + 3)]):
+        dialect = dialectCsv
+    if strings:
+        coords, tokens = ParseBlock(lines[first:last], strings=True)
+    else:
+        coords = ParseBlock(lines[first:last])
+    rows = None     # rows of the block kept, in order (None : all)
+
+    # Lednicer : first row is the point count of each side
+    nUpper = 0
+    if len(coords) > 2 and coords[0, 0] > 1.5 and coords[0, 1] > 1.5 \
+            and coords[0, 0] == int(coords[0, 0]) and coords[0, 1] == int(coords[0, 1]):
+        nUpper = int(coords[0, 0])
+        coords = coords[1:]
+        rows = np.arange(1, len(coords) + 1)
+        if dialect != dialectHeaderless:
+            dialect = dialectLednicer
+
+    # sides given separately : a jump in x starts the second side
+    # (counts are not always reliable, used only if no jump is found)
+    if len(coords) > 3:
+        jumps = np.nonzero(np.abs(np.diff(coords[:, 0])) > sideJump)[0]
+        k = None
+        if len(jumps) == 1:
+            k = jumps[0] + 1
+        elif len(jumps) == 0 and 1 < nUpper < len(coords):
+            k = nUpper
+        if k is not None:
+            order = SidesOrder(coords[:k], coords[k:])
+            coords = coords[order]
+            rows = order if rows is None else rows[order]
+
+    if len(coords) < 3:
+        raise ValueError("Did not find enough coordinates")
+    coords = np.ascontiguousarray(coords, dtype=np.float64)
+    if strings:
+        return title, coords, dialect, (tokens if rows is None else tokens[rows]).tolist()
+    return title, coords, dialect
+
+def ReadDat(filename):
+    "title and unit chord coords ((N, 2) array, Selig order) of an airfoil file"
+    title, coords, dialect = ParseDatText(ReadText(filename), os.path.splitext(os.path.basename(filename))[0])
+    return title, coords
+
+def ReadDatStrings(filename):
+    "title and original x, y strings (list of pairs, same rows and order as ReadDat) of an airfoil file"
+    title, coords, dialect, strings = ParseDatText(ReadText(filename), os.path.splitext(os.path.basename(filename))[0],
+                                                   strings=True)
+    return title, strings
+
+def ReadDatInfos(filename):
+    "title, dialect, point count and status ('ok', 'error') of an airfoil file"
+    name = os.path.splitext(os.path.basename(filename))[0]
+    try:
+        text = ReadText(filename)
+    except OSError:
+        return {'title': '', 'dialect': '', 'points': 0, 'status': 'error'}
+    try:
+        title, coords, dialect = ParseDatText(text, name)
+    except ValueError:
+        lines = text.splitlines()
+        title = lines[0].strip() if lines else ''
+        return {'title': title, 'dialect': '', 'points': 0, 'status': 'error'}
+    return {'title': title, 'dialect': dialect, 'points': len(coords), 'status': 'ok'}
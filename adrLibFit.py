@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# *******************************************************************************
+# *  Ader workbench                                                             *
+# *    For more details see InitGui.py and the LICENCE text file.               *
+# *                                                                             *
+# *  Module : adrLibFit.py                                                      *
+# *    Least squares B-spline fitting : fewest poles for a max deviation        *
+# *     - clamped cubic B-spline, ends on the first and last points             *
+# *     - fixed points (foil leading edge) interpolated, a knot on each         *
+# *     - knots inserted where the deviation exceeds the tolerance              *
+# *     - parameters corrected (points projected on the curve)                  *
+# *                                                                             *
+# *  Dependencies :                                                             *
+# *    numpy (no FreeCAD import)                                                *
+# *                                                                             *
+# *  History :                                                                  *
+# *    2026-10-18 : initial release                                             *
+# *                                                                             *
+# *******************************************************************************
+
+__title__ = "Ader Workbench - B-spline fitting"
+__author__ = "Claude GUTH"
+
+import numpy as np
+
+degree = 3
+
+def ChordParameters(points):
+    "chord length parameters of points, in [0, 1]"
+    t = np.concatenate(([0.0], np.cumsum(np.linalg.norm(np.diff(points, axis=0), axis=1))))
+    return t / t[-1] if t[-1] > 0 else np.linspace(0, 1, len(points))
+
+def FullKnots(knots, degree=degree):
+    "clamped knot vector (multiplicities expanded) of distinct knots"
+    return np.concatenate(([knots[0]]*degree, knots, [knots[-1]]*degree))
+
+def BasisMatrix(u, knots, degree=degree):
+    """
+    Basis functions of the clamped B-spline with distinct knots at u,
+    (len(u), nbPoles) array : curve points = BasisMatrix @ poles.
+    """
+    t = FullKnots(knots, degree)
+    nbPoles = len(t) - degree - 1
+    span = np.clip(np.searchsorted(t, u, side='right') - 1, degree, nbPoles - 1)
+    n = np.zeros((len(u), degree + 1))
+    n[:, 0] = 1.0
+    left = np.zeros_like(n)
+    right = np.zeros_like(n)
+    for j in range(1, degree + 1):
+        left[:, j] = u - t[span + 1 - j]
+        right[:, j] = t[span + j] - u
+        saved = np.zeros(len(u))
+        for r in range(j):
+            temp = n[:, r] / (right[:, r + 1] + left[:, j - r])
+            n[:, r] = saved + right[:, r + 1]*temp
+            saved = left[:, j - r]*temp
+        n[:, j] = saved
+    a = np.zeros((len(u), nbPoles))
+    rows = np.arange(len(u))[:, None]
+    a[rows, span[:, None] - degree + np.arange(degree + 1)] = n
+    return a
+
+# fairing weight (second differences of the poles), relative to the data
+# weight : keeps the poles of knot spans with few points from exploding
+fairing = 1e-6
+
+def SolvePoles(a, points, fixed):
+    """
+    Poles minimizing the distances to points, ends and fixed points
+    interpolated (least squares with equality constraints, KKT system).
+    """
+    nbPoles = a.shape[1]
+    first, last = points[0], points[-1]
+    # fairing : second differences of all poles, ends moved to the rhs
+    d2 = np.diff(np.eye(nbPoles), 2, axis=0)
+    w = fairing*np.trace(a.T @ a) / nbPoles
+    rhs = points - np.outer(a[:, 0], first) - np.outer(a[:, -1], last)
+    rhsFair = -np.outer(d2[:, 0], first) - np.outer(d2[:, -1], last)
+    free = a[:, 1:-1]
+    freeFair = d2[:, 1:-1]
+    c = free[fixed]
+    m = len(fixed)
+    kkt = np.zeros((nbPoles - 2 + m, nbPoles - 2 + m))
+    kkt[:nbPoles - 2, :nbPoles - 2] = free.T @ free + w*freeFair.T @ freeFair
+    kkt[:nbPoles - 2, nbPoles - 2:] = c.T
+    kkt[nbPoles - 2:, :nbPoles - 2] = c
+    b = np.concatenate((free.T @ rhs + w*freeFair.T @ rhsFair, rhs[fixed]))
+    try:
+        x = np.linalg.solve(kkt, b)
+    except np.linalg.LinAlgError:
+        x = np.linalg.lstsq(kkt, b, rcond=None)[0]
+    return np.vstack((first, x[:nbPoles - 2], last))
+
+
+def CorrectParameters(u, points, knots, poles, fixed, iterations=2):
+    """
+    Parameters moved toward the foot of the points on the curve
+    (Gauss-Newton, finite difference tangent), each kept between its
+    neighbours : the order is kept, ends and fixed points unchanged.
+    """
+    h = 1e-7
+    moving = np.ones(len(u), dtype=bool)
+    moving[[0, -1]] = False
+    moving[fixed] = False
+    for i in range(iterations):
+        c0, cp = (BasisMatrix(v, knots) @ poles for v in (u, np.minimum(u + h, 1.0)))
+        d1 = (cp - c0) / np.maximum(np.minimum(u + h, 1.0) - u, 1e-300)[:, None]
+        d1[u >= 1.0] = 0.0
+        den = (d1*d1).sum(axis=1)
+        step = np.where(den > 1e-30, ((c0 - points)*d1).sum(axis=1) / np.where(den > 1e-30, den, 1.0), 0.0)
+        lower = np.concatenate(([0.0], 0.5*(u[:-1] + u[1:])))
+        upper = np.concatenate((0.5*(u[:-1] + u[1:]), [1.0]))
+        u = np.where(moving, np.clip(u - step, lower, upper), u)
+    return u
+
+class BSplineFit:
+    "clamped B-spline : poles, distinct knots, multiplicities, max deviation"
+    __slots__ = ('poles', 'knots', 'mults', 'degree', 'deviation')
+
+    def __init__(self, poles, knots, deviation, degree=degree):
+        self.poles = poles
+        self.knots = knots
+        self.mults = [degree + 1] + [1]*(len(knots) - 2) + [degree + 1]
+        self.degree = degree
+        self.deviation = deviation
+
+    def __len__(self):
+        return len(self.poles)
+
+    def __call__(self, u):
+        "points at parameters u"
+        return BasisMatrix(np.atleast_1d(np.asarray(u, dtype=np.float64)), self.knots, self.degree) @ self.poles
+
+
+def FitBSpline(points, tolerance, fixed=(), maxPoles=None):
+    """
+    Cubic B-spline approximating points ((N, dim)) within tolerance, ends
+    and points of index in fixed interpolated.
+    Knots start at the fixed points and are inserted (median parameter of
+    the span points) in the spans exceeding tolerance, until the tolerance
+    or maxPoles (default : N) is met.
+    deviation : max distance of the points to the curve at their parameter
+    (upper bound of the distance to the curve).
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) < 2:
+        raise ValueError("Not enough points")
+    maxPoles = max(degree + 1, min(maxPoles or len(points), len(points)))
+    u = ChordParameters(points)
+    fixed = sorted(i for i in set(fixed) if 0 < i < len(points) - 1)
+    knots = np.unique(np.concatenate(([0.0, 1.0], u[fixed])))
+    while True:
+        a = BasisMatrix(u, knots)
+        poles = SolvePoles(a, points, fixed)
+        u = CorrectParameters(u, points, knots, poles, fixed)
+        a = BasisMatrix(u, knots)
+        poles = SolvePoles(a, points, fixed)
+        errors = np.linalg.norm(a @ poles - points, axis=1)
+        deviation = float(errors.max())
+        nbPoles = len(knots) + degree - 1
+        if deviation <= tolerance or nbPoles >= maxPoles:
+            return BSplineFit(poles, knots, deviation)
+        spans = np.clip(np.searchsorted(knots, u, side='right') - 1, 0, len(knots) - 2)
+        inserted = []
+        for s in np.unique(spans[errors > tolerance]):
+            inside = u[(spans == s) & (u > knots[s]) & (u < knots[s + 1])]
+            if len(inside):
+                inserted.append(np.median(inside))
+        inserted = inserted[:maxPoles - nbPoles]
+        if not inserted:
+            return BSplineFit(poles, knots, deviation)
+        knots = np.unique(np.concatenate((knots, inserted)))
@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+# *******************************************************************************
+# *  Ader workbench                                                             *
+# *    For more details see InitGui.py and the LICENCE text file.               *
+# *                                                                             *
+# *  Module : adrLibGeom.py                                                     *
+# *    Geometry core, no FreeCAD import : plain (N, 2) arrays                   *
+# *     - foil coords from dat files (adrLibDat, cache) or NACA designations    *
+# *     - chord / setting transform, repaneling                                 *
+# *     - nacelle (low drag bodies) profiles : Lyon, Hoerner, Duhamel, NACA,    *
+# *       evenly spaced or adaptive (arc length and curvature), metrics         *
+# *       (volume, areas, fineness) by quadrature                               *
+# *     - cubic interpolation (compatibility)                                   *
+# *     - Polyline : compact array backed points, transformed in place          *
+# *    With adrLibDat, adrLibNaca, adrLibSpline and adrLibRepanel it can be     *
+# *    used in worker processes and benchmarks without FreeCAD.                 *
+# *    adrLibShapes is the FreeCAD adapter (vectors, sketches).                 *
+# *                                                                             *
+# *  Dependencies :                                                             *
+# *    numpy, adrLibDat, adrLibNaca, adrLibSpline, adrLibRepanel                *
+# *                                                                             *
+# *  History :                                                                  *
+# *    2026-10-18 : initial release, code moved from adrLibShapes               *
+# *    2026-10-18 : vectorized nacelle laws, adaptive sampling (chord height)   *
+# *    2026-10-18 : nacelle metrics by quadrature, cached                       *
+# *    2026-10-18 : Polyline, array backed points shared with adrLibPart        *
+# *    2026-10-18 : Polyline mirrored blocks (no symmetric copy)                *
+# *    2026-10-18 : regex reader removed, original strings from adrLibDat       *
+# *                                                                             *
+# *******************************************************************************
+
+__title__ = "Ader Workbench - geometry core"
+__author__ = "Dirk GORISSEN, Claude GUTH, Jakob HEIKO"
+
+import os
+import math
+import functools
+from collections import OrderedDict
+import numpy as np
+import adrLibDat
+import adrLibNaca
+import adrLibSpline
+import adrLibRepanel
+
+class Polyline:
+    """
+    Compact point list : a (N, 3) float64 array, transformed in place.
+    closed marks a closed outline without storing the first point twice.
+    Converted to vectors once, at the FreeCAD boundary (adrLibPart.Vectors).
+    """
+    __slots__ = ('xyz', 'closed')
+
+    def __init__(self, coords, closed=False):
+        coords = np.asarray(coords, dtype=np.float64)
+        if coords.ndim != 2 or coords.shape[1] not in (2, 3):
+            raise ValueError("Polyline needs (N, 2) or (N, 3) coords")
+        if coords.shape[1] == 2:
+            xyz = np.zeros((len(coords), 3))
+            xyz[:, :2] = coords
+        else:
+            xyz = coords if coords.flags.writeable else coords.copy()
+        self.xyz = xyz
+        self.closed = closed
+
+    def __len__(self):
+        return len(self.xyz) + (1 if self.closed else 0)
+
+    def __iter__(self):
+        "points as (x, y, z) tuples, first point repeated if closed"
+        for chunk in self.Chunks():
+            yield from zip(*chunk)
+        if self.closed:
+            yield tuple(self.xyz[0].tolist())
+
+    def Chunks(self, size=256, start=0, mirror=None):
+        """
+        x, y, z float lists of successive blocks of points from start
+        (bounded temporary memory), mirror : axis negated in the blocks
+        """
+        sign = None
+        if mirror is not None:
+            sign = np.ones(3)
+            sign[mirror] = -1.0
+        for i in range(start, len(self.xyz), size):
+            block = self.xyz[i:i + size]
+            yield (block if sign is None else block*sign).T.tolist()
+
+    def IsClosed(self):
+        "closed flag, or first and last points equal"
+        return self.closed or bool(np.array_equal(self.xyz[0], self.xyz[-1]))
+
+    def Close(self):
+        "close the outline (no point added if first and last points are equal)"
+        self.closed = not np.array_equal(self.xyz[0], self.xyz[-1])
+        return self
+
+    def Transform(self, matrix, offset=None):
+        "in place : points * matrix (3x3 or 2x2 on x, y) + offset"
+        matrix = np.asarray(matrix, dtype=np.float64)
+        n = matrix.shape[0]
+        self.xyz[:, :n] = self.xyz[:, :n] @ matrix.T
+        if offset is not None:
+            self.xyz[:, :len(offset)] += offset
+        return self
+
+    def Scale(self, k):
+        self.xyz *= k
+        return self
+
+    def Rotate(self, angle):
+        "in place rotation around Z, angle in degrees"
+        a = math.radians(angle)
+        return self.Transform([[math.cos(a), -math.sin(a)], [math.sin(a), math.cos(a)]])
+
+    def Translate(self, offset):
+        self.xyz[:, :len(offset)] += offset
+        return self
+
+    def Mirror(self, axis=1):
+        "in place symmetry : coordinate axis (0 x, 1 y, 2 z) negated"
+        self.xyz[:, axis] *= -1.0
+        return self
+
+    def Reversed(self):
+        "points in reverse order : view, no copy"
+        return Polyline(self.xyz[::-1], self.closed)
+
+
+class FoilCoordsCache:
+    """
+    Bounded LRU cache of unit chord foil coords, keyed by file identity
+    (path, mtime, size). Coords are stored as a (N, 2) float64 array.
+    packProvider() returns a foil pack (adrLibPack) looked up first, or None.
+    """
+
+    def __init__(self, maxSize=64, packProvider=None):
+        self.maxSize = maxSize
+        self.packProvider = packProvider
+        self.items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def Get(self, filename):
+        "foil name and unit chord coords array, parsed once per file identity"
+        st = os.stat(filename)
+        key = (os.path.realpath(filename), st.st_mtime_ns, st.st_size)
+        item = self.items.get(key)
+        if item is not None:
+            self.hits += 1
+            self.items.move_to_end(key)
+            return item
+        self.misses += 1
+        item = None
+        pack = self.packProvider() if self.packProvider else None
+        if pack is not None:
+            i = pack.Find(filename, st)
+            if i is not None:
+                item = pack.Coords(i)   # zero copy view
+        if item is None:
+            name, coords = adrLibDat.ReadDat(filename)
+            coords.setflags(write=False)
+            item = (name, coords)
+        self.items[key] = item
+        while len(self.items) > self.maxSize:
+            self.items.popitem(last=False)
+        return item
+
+    def Invalidate(self, filename=None):
+        "drop cached coords of a file, or all coords"
+        if filename is None:
+            self.items.clear()
+            return
+        path = os.path.realpath(filename)
+        for key in [k for k in self.items if k[0] == path]:
+            del self.items[key]
+
+    def Infos(self):
+        return {'size': len(self.items), 'maxSize': self.maxSize, 'hits': self.hits, 'misses': self.misses}
+
+foilCache = FoilCoordsCache()
+
+def TransformFoilCoords(coords, chord = 1.0, setting = 0):
+    "scale and rotate (setting in degrees) unit chord coords, returns a (N, 2) array"
+    s = math.radians(setting)
+    c = chord*math.cos(s)
+    d = chord*math.sin(s)
+    return coords @ np.array([[c, -d], [d, c]])
+
+def FoilCoords(filename, chord = 1.0, setting = 0, nbPoints=0, spacing=adrLibRepanel.spacingCosine,
+               tolerance=adrLibRepanel.defaultTolerance, cache=None):
+    """
+    Foil name and (N, 2) coords of a dat file or a NACA designation (NACA2412...),
+    scaled to chord, rotated by setting (degrees), repaneled if nbPoints > 0.
+    """
+    if adrLibNaca.IsNaca(filename):
+        airfoilname, unitCoords = adrLibNaca.NacaFoil(filename)
+    else:
+        airfoilname, unitCoords = (foilCache if cache is None else cache).Get(filename)
+    if nbPoints:
+        unitCoords = adrLibRepanel.Repanel(unitCoords, nbPoints, spacing, tolerance)
+    return airfoilname, TransformFoilCoords(unitCoords, chord, setting)
+
+def FoilStrings(filename):
+    "foil name and coords as strings : original strings of a dat file, NACA with 6 decimals"
+    if adrLibNaca.IsNaca(filename):
+        airfoilname, unitCoords = adrLibNaca.NacaFoil(filename)
+        return airfoilname, [[f"{x:.6f}", f"{y:.6f}"] for x, y in unitCoords.tolist()]
+    return adrLibDat.ReadDatStrings(filename)
+
+def linspace(start,stop,np):
+    """
+    Emulate Matlab linspace
+    """
+    return [start+(stop-start)*i/(np-1) for i in range(np)]
+
+def interpolate(xa,ya,queryPoints):
+    """
+    A cubic spline interpolation on a given set of points (x,y)
+    Kept for compatibility : use adrLibSpline.CubicSpline, factored once
+    and evaluated on arrays
+    """
+    return adrLibSpline.CubicSpline(xa, ya)(queryPoints).tolist()
+
+
+#***************************************************************************
+#*                                                                         *
+#*   Nacelle profiles (low drag bodies), positive ordinates                *
+#*   https://fr.wikipedia.org/wiki/Corps_de_moindre_tra%C3%AEn%C3%A9e.     *
+#*   (N, 2) arrays (x, y), x from 0 to length                              *
+#*                                                                         *
+#*   Author :   Claude GUTH                                                *
+#*   Created :  2021-07-28                                                 *
+#*                                                                         *
+#***************************************************************************
+
+# nacelle types
+nacelleLyon = 'Lyon'
+nacelleHoerner = 'Hoerner'
+nacelleDuhamel = 'Duhamel'
+nacelleNaca = 'NACA'
+nacelleTypes = [nacelleLyon, nacelleHoerner, nacelleDuhamel, nacelleNaca]
+
+# adaptive sampling : dense stations per profile, correction passes
+denseStations = 2000
+adaptivePasses = 6
+
+def LyonLaw(xRel, length, diameter):
+    "Lyon model A ordinates at xRel (0..1)"
+    ky = diameter*1.11326
+    return ky*np.sqrt(np.maximum(xRel - xRel**2 - xRel**3 + xRel**4, 0.0))
+
+def HoernerLaw(xRel, length, diameter, xRelMax=0.4):
+    "Hoerner (FEC) ordinates at xRel (0..1) : ellipse, then cosine from xRelMax"
+    x = xRel*length
+    xeMax = xRelMax*length
+    yeMax = 0.5*diameter
+    yFront = yeMax*np.sqrt(np.maximum(2*x*xeMax - x*x, 0.0)) / np.maximum(xeMax, 1e-300)
+    yRear = yeMax*np.cos(0.5*math.pi*(xeMax - x) / np.maximum(length - xeMax, 1e-300))
+    y = np.where(x < xeMax, yFront, yRear)
+    return np.where(xRel <= 0, 0.0, y)
+
+def DuhamelLaw(xRel, length, diameter):
+    "simplified Duhamel ordinates at xRel (0..1)"
+    ky = diameter*1.3
+    return ky*(1 - xRel)*np.sqrt(xRel)
+
+def NacaBodyLaw(xRel, length, diameter):
+    "NACA 4 digit thickness law ordinates at xRel (0..1)"
+    ky = 5*diameter*diameter/length
+    return ky*(adrLibNaca.a0*np.sqrt(xRel) + xRel*(adrLibNaca.a1 + xRel*(adrLibNaca.a2 + xRel*(adrLibNaca.a3 + xRel*adrLibNaca.a4Closed))))
+
+nacelleLaws = {nacelleLyon: LyonLaw, nacelleHoerner: HoernerLaw, nacelleDuhamel: DuhamelLaw, nacelleNaca: NacaBodyLaw}
+
+def ChordHeights(dense, stations):
+    "distance of each dense point to the chord of the stations interval holding it"
+    i = np.clip(np.searchsorted(stations, np.arange(len(dense)), side='right') - 1, 0, len(stations) - 2)
+    a = dense[stations[i]]
+    ab = dense[stations[i + 1]] - a
+    ap = dense - a
+    return np.abs(ab[:, 0]*ap[:, 1] - ab[:, 1]*ap[:, 0]) / np.maximum(np.hypot(*ab.T), 1e-300)
+
+def AdaptiveStations(law, length, tolerance, maxPoints=None, maxSegment=None):
+    """
+    xRel (0..1) of a profile y = law(xRel), placed by arc length and curvature :
+    segment length sqrt(8 * tolerance / curvature) so that the chord height
+    stays under tolerance (length unit), at most maxSegment (default length/10).
+    Density is raised until the chord heights on dense samples meet tolerance,
+    up to maxPoints.
+    """
+    u = np.linspace(0.0, 1.0, denseStations)
+    xRel = 0.5*(1.0 - np.cos(math.pi*u))     # dense at both ends, sqrt noses resolved
+    dense = np.column_stack((xRel*length, law(xRel)))
+    d1 = np.gradient(dense, u, axis=0)
+    d2 = np.gradient(d1, u, axis=0)
+    curvature = np.abs(d1[:, 0]*d2[:, 1] - d1[:, 1]*d2[:, 0]) / np.maximum(np.hypot(*d1.T)**3, 1e-300)
+    s = np.concatenate(([0.0], np.cumsum(np.hypot(*np.diff(dense, axis=0).T))))
+    maxSegment = maxSegment or 0.1*length
+    base = np.maximum(np.sqrt(curvature / (8.0*tolerance)), 1.0/maxSegment)
+    scale = 1.0
+    for i in range(adaptivePasses):
+        w = scale*base
+        cw = np.concatenate(([0.0], np.cumsum(0.5*(w[1:] + w[:-1])*np.diff(s))))
+        n = max(int(math.ceil(cw[-1])) + 1, 3)
+        if maxPoints:
+            n = min(n, maxPoints)
+        stations = np.unique(np.rint(np.interp(np.linspace(0.0, cw[-1], n), cw, np.arange(len(u)))).astype(int))
+        error = ChordHeights(dense, stations).max()
+        if error <= tolerance or (maxPoints and n >= maxPoints):
+            break
+        scale *= 1.05*math.sqrt(error / tolerance)
+    return xRel[stations]
+
+def NacelleProfile(nacelleType, length, diameter, xRelMax=0.4, nbPoints=100, tolerance=None):
+    """
+    Nacelle profile ((N, 2) array, positive ordinates, x from 0 to length).
+    tolerance None : nbPoints evenly spaced along x.
+    tolerance (length unit) : adaptive sampling meeting this chord height,
+    nbPoints is then the max number of points (0 : no max).
+    """
+    law = nacelleLaws[nacelleType]
+    if nacelleType == nacelleHoerner:
+        law = functools.partial(law, xRelMax=xRelMax)
+    if tolerance:
+        xRel = AdaptiveStations(lambda xr: law(xr, length, diameter), length, tolerance, nbPoints)
+    else:
+        xRel = np.linspace(0.0, 1.0, nbPoints)
+    return np.column_stack((xRel*length, law(xRel, length, diameter)))
+
+def NacelleMetrics(nacelleType, length, diameter, xRelMax=0.4, nbStations=denseStations):
+    """
+    Metrics of full revolution nacelles, by quadrature over the profile law
+    (half cosine stations, trapezoids along the arc for the wetted area).
+    length, diameter (and xRelMax) : scalars or arrays, broadcast together.
+    Returns a dict of arrays : volume, wettedArea, frontalArea, maxDiameter,
+    fineness (length / max diameter), xMaxRel (position of the max diameter).
+    """
+    law = nacelleLaws[nacelleType]
+    if nacelleType == nacelleHoerner:
+        law = functools.partial(law, xRelMax=np.asarray(xRelMax, dtype=np.float64)[..., None])
+    length, diameter = np.broadcast_arrays(np.asarray(length, dtype=np.float64), np.asarray(diameter, dtype=np.float64))
+    L, D = length[..., None], diameter[..., None]
+    xRel = 0.5*(1.0 - np.cos(np.linspace(0.0, math.pi, nbStations)))
+    x = xRel*L
+    y = law(xRel, L, D)
+    dx = np.diff(x, axis=-1)
+    ds = np.hypot(dx, np.diff(y, axis=-1))
+    volume = math.pi*(0.5*(y[..., :-1]**2 + y[..., 1:]**2)*dx).sum(axis=-1)
+    wettedArea = 2*math.pi*(0.5*(y[..., :-1] + y[..., 1:])*ds).sum(axis=-1)
+    # max : vertex of the parabola through the max station and its neighbours
+    i = np.clip(np.argmax(y, axis=-1), 1, nbStations - 2)[..., None]
+    x0, x1, x2 = (np.take_along_axis(x, i + k, axis=-1)[..., 0] for k in (-1, 0, 1))
+    y0, y1, y2 = (np.take_along_axis(y, i + k, axis=-1)[..., 0] for k in (-1, 0, 1))
+    d01, d12 = (y1 - y0)/(x1 - x0), (y2 - y1)/(x2 - x1)
+    a = (d12 - d01)/(x2 - x0)
+    curved = a < -1e-300
+    aSafe = np.where(curved, a, -1.0)
+    xTop = np.where(curved, 0.5*(x0 + x1) - d01/(2*aSafe), x1)
+    yTop = np.where(curved, y1 + d01*(xTop - x1) + a*(xTop - x0)*(xTop - x1), y1)
+    yTop = np.maximum(yTop, y.max(axis=-1))
+    maxDiameter = 2*yTop
+    return {'volume': volume, 'wettedArea': wettedArea, 'frontalArea': math.pi*yTop**2,
+            'maxDiameter': maxDiameter, 'fineness': length/np.maximum(maxDiameter, 1e-300),
+            'xMaxRel': xTop/np.maximum(length, 1e-300)}
+
+@functools.lru_cache(maxsize=1024)
+def CachedNacelleMetrics(nacelleType, length, diameter, xRelMax=0.4):
+    "NacelleMetrics of one nacelle as floats, cached by parameters"
+    if nacelleType != nacelleHoerner:
+        xRelMax = 0.4       # unused, one cache entry
+    return {k: float(v) for k, v in NacelleMetrics(nacelleType, length, diameter, xRelMax).items()}
+
+def LyonProfile(length, diameter, nbPoints=100, tolerance=None):
+    "Lyon model A"
+    return NacelleProfile(nacelleLyon, length, diameter, nbPoints=nbPoints, tolerance=tolerance)
+
+def HoernerProfile(length, diameter, xRelMax, nbPoints=100, tolerance=None):
+    "Hoerner (FEC), max thickness at xRelMax (0..1)"
+    return NacelleProfile(nacelleHoerner, length, diameter, xRelMax, nbPoints, tolerance)
+
+def DuhamelProfile(length, diameter, nbPoints=100, tolerance=None):
+    "simplified Duhamel"
+    return NacelleProfile(nacelleDuhamel, length, diameter, nbPoints=nbPoints, tolerance=tolerance)
+
+def NacaBodyProfile(length, diameter, nbPoints=100, tolerance=None):
+    "NACA 4 digit thickness law"
+    return NacelleProfile(nacelleNaca, length, diameter, nbPoints=nbPoints, tolerance=tolerance)
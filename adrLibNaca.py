@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# *******************************************************************************
+# *  Ader workbench                                                             *
+# *    For more details see InitGui.py and the LICENCE text file.               *
+# *                                                                             *
+# *  Module : adrLibNaca.py                                                     *
+# *    NACA 4 and 5 digit airfoils, vectorized                                  *
+# *     - a batch of designations on a shared x distribution in one pass        *
+# *     - coords returned as a (foils, 2n+1, 2) array, Selig order              *
+# *     - same equations as the adrLibShapes generators (D. Gorissen code)      *
+# *     - designations as virtual foil files : "NACA2412" resolves to memoized  *
+# *       generated coords                                                      *
+# *                                                                             *
+# *  Dependencies :                                                             *
+# *    numpy, adrLibSpline (no FreeCAD import)                                  *
+# *                                                                             *
+# *  History :                                                                  *
+# *    2026-10-18 : initial release                                             *
+# *    2026-10-18 : 5 digit designations checked, reflexed camber lines         *
+# *                                                                             *
+# *******************************************************************************
+
+__title__ = "Ader Workbench - NACA airfoils"
+__author__ = "Dirk GORISSEN, Claude GUTH"
+
+import re
+import functools
+import itertools
+import numpy as np
+import adrLibSpline
+
+# thickness polynomial
+a0, a1, a2, a3 = 0.2969, -0.1260, -0.3516, 0.2843
+a4Closed = -0.1036      # zero thickness trailing edge
+a4Finite = -0.1015      # finite thickness trailing edge
+
+# 5 digit camber line tables : max camber position, m, k1
+tableP = np.array([0.05, 0.1, 0.15, 0.2, 0.25])
+tableM = np.array([0.0580, 0.1260, 0.2025, 0.2900, 0.3910])
+tableK = np.array([361.4, 51.64, 15.957, 6.643, 3.230])
+splineM = adrLibSpline.CubicSpline(tableP, tableM)     # m(p)
+splineK = adrLibSpline.CubicSpline(tableM, tableK)     # k1(m)
+# reflexed camber lines (third digit 1), P = 2..5 : m, k1, k2/k1
+reflexP = np.array([0.1, 0.15, 0.2, 0.25])
+reflexM = np.array([0.1300, 0.2170, 0.3180, 0.4410])
+reflexK = np.array([51.990, 15.793, 6.520, 3.191])
+reflexR = np.array([0.000764, 0.00677, 0.0303, 0.1355])
+
+# virtual foil files : designation pattern, generated sections
+nacaPattern = re.compile(r'^NACA[\s_-]*\d{4,5}$', re.IGNORECASE)
+sectionPoints = 60      # stations per side
+sectionCacheSize = 128
+
+def Spacing(n, halfCosine=False):
+    "n+1 stations in [0, 1], linear or half cosine"
+    if halfCosine:
+        return 0.5*(1.0 - np.cos(np.linspace(0.0, np.pi, n + 1)))
+    return np.linspace(0.0, 1.0, n + 1)
+
+def Digits(number):
+    """
+    'NACA 2412', 'naca23012', '2412' -> '2412', ValueError if not a 4 digit
+    or a 5 digit section (L, P in 1..5, reflex digit 0 or 1, no reflexed
+    camber for P = 1) or zero thickness.
+    16 and 6 series designations are rejected.
+    """
+    digits = str(number).strip().upper()
+    if digits.startswith('NACA'):
+        digits = digits[4:].strip(' -_')
+    valid = digits.isdigit() and len(digits) in (4, 5) and int(digits[-2:]) > 0
+    if valid and len(digits) == 5:
+        valid = digits[0] in '12345' and digits[1] in '12345' and digits[2] in '01' and digits[1:3] != '11'
+    if not valid:
+        raise ValueError(f"Invalid NACA number : {number}")
+    return digits
+
+def Thickness(t, x, finiteTE=False):
+    "half thickness (foils, stations) for relative thicknesses t (foils,)"
+    a4 = a4Finite if finiteTE else a4Closed
+    poly = a0*np.sqrt(x) + x*(a1 + x*(a2 + x*(a3 + x*a4)))
+    return 5*t[:, None]*poly[None, :]
+
+def Assemble(x, yt, yc, dyc):
+    "upper and lower sides from camber line and thickness, TE > upper > LE > lower > TE"
+    theta = np.arctan(dyc)
+    s, c = np.sin(theta), np.cos(theta)
+    xu, yu = x - yt*s, yc + yt*c
+    xl, yl = x + yt*s, yc - yt*c
+    X = np.concatenate((xu[:, ::-1], xl[:, 1:]), axis=1)
+    Z = np.concatenate((yu[:, ::-1], yl[:, 1:]), axis=1)
+    return np.stack((X, Z), axis=2)
+
+def Naca4Params(numbers):
+    "(foils, 3) array of max camber, its position, thickness from 4 digit strings"
+    return np.array([[int(d[0])/100.0, int(d[1])/10.0, int(d[2:])/100.0] for d in map(Digits, numbers)])
+
+def Naca4(numbers, x, finiteTE=False):
+    """
+    4 digit foils, numbers : 4 digit strings or a (foils, 3) array of
+    (m, p, t) relative values, x : stations (n+1,).
+    Returns a (foils, 2n+1, 2) array.
+    """
+    params = np.asarray(numbers, dtype=np.float64) if not isinstance(numbers[0], str) else Naca4Params(numbers)
+    x = np.asarray(x, dtype=np.float64)
+    m, p, t = params[:, 0:1], params[:, 1:2], params[:, 2]
+    yt = Thickness(t, x, finiteTE)
+    cambered = p > 0
+    m = np.where(cambered, m, 0.0)
+    p = np.where(cambered, p, 0.5)
+    front = x[None, :] <= p
+    k = np.where(front, m/p**2, m/(1 - p)**2)
+    yc = np.where(front, k*x*(2*p - x), k*(1 - 2*p + x)*(1 - x))
+    dyc = k*(2*p - 2*x)
+    return Assemble(x, yt, yc, dyc)
+
+def Naca5Params(numbers):
+    "(foils, 4) array of design lift coefficient, max camber position, thickness, reflex"
+    return np.array([[int(d[0])*0.15, int(d[1])*0.05, int(d[3:])/100.0, int(d[2])] for d in map(Digits, numbers)])
+
+def Naca5(numbers, x, finiteTE=False):
+    """
+    5 digit foils, numbers : 5 digit strings or a (foils, 3) array of
+    (cld, p, t) values, a 4th column 1 for reflexed camber lines,
+    x : stations (n+1,).
+    Returns a (foils, 2n+1, 2) array.
+    """
+    params = np.asarray(numbers, dtype=np.float64) if not isinstance(numbers[0], str) else Naca5Params(numbers)
+    x = np.asarray(x, dtype=np.float64)
+    cld, p, t = params[:, 0:1], params[:, 1:2], params[:, 2]
+    reflex = params[:, 3:4] > 0 if params.shape[1] > 3 else np.zeros_like(p, dtype=bool)
+    yt = Thickness(t, x, finiteTE)
+    m = np.where(reflex, np.interp(p, reflexP, reflexM), splineM(p))
+    k1 = np.where(reflex, np.interp(p, reflexP, reflexK), splineK(m))
+    r = np.where(reflex, np.interp(p, reflexP, reflexR), 0.0)
+    cambered = p > 0
+    front = x[None, :] <= p
+    yc = np.where(front, k1/6.0*(x**3 - 3*m*x**2 + m**2*(3 - m)*x), k1/6.0*m**3*(1 - x))
+    dyc = np.where(front, k1/6.0*(3*x**2 - 6*m*x + m**2*(3 - m)), k1/6.0*m**3)
+    # reflexed : k1/6 ((x-m)^3 - r (1-m)^3 x - m^3 x + m^3), r (x-m)^3 aft of m
+    ahead = np.where(x[None, :] <= m, 1.0, r)
+    ycReflex = k1/6.0*(ahead*(x - m)**3 - r*(1 - m)**3*x - m**3*x + m**3)
+    dycReflex = k1/6.0*(3*ahead*(x - m)**2 - r*(1 - m)**3 - m**3)
+    yc = np.where(reflex, ycReflex, yc)
+    dyc = np.where(reflex, dycReflex, dyc)
+    yc = np.where(cambered, cld/0.3*yc, 0.0)
+    dyc = np.where(cambered, cld/0.3*dyc, 0.0)
+    return Assemble(x, yt, yc, dyc)
+
+def NacaCoords(numbers, n, finiteTE=False, halfCosine=False):
+    """
+    Unit chord coords of NACA foils (4 and 5 digits may be mixed),
+    n+1 stations per side. Returns a (foils, 2n+1, 2) array.
+    """
+    digits = [Digits(number) for number in numbers]
+    x = Spacing(n, halfCosine)
+    coords = np.empty((len(digits), 2*n + 1, 2))
+    for length, generator in ((4, Naca4), (5, Naca5)):
+        rows = [i for i, d in enumerate(digits) if len(d) == length]
+        if rows:
+            coords[rows] = generator([digits[i] for i in rows], x, finiteTE)
+    return coords
+
+def Naca4Sweep(cambers=range(10), positions=range(10), thicknesses=range(1, 41)):
+    """
+    (m, p, t) relative values of all 4 digit combinations of the digit
+    ranges (design sweeps), to feed Naca4. Returns a (foils, 3) array.
+    """
+    combos = itertools.product(cambers, positions, thicknesses)
+    return np.array([(m/100.0, p/10.0, t/100.0) for m, p, t in combos])
+
+def IsNaca(name):
+    "True for a NACA designation used as a foil name : 'NACA2412', 'naca 23012'"
+    if not isinstance(name, str) or nacaPattern.match(name.strip()) is None:
+        return False
+    try:
+        Digits(name)
+    except ValueError:
+        return False
+    return True
+
+@functools.lru_cache(maxsize=sectionCacheSize)
+def NacaSection(digits, n=sectionPoints, finiteTE=False, halfCosine=True):
+    "memoized unit chord coords ((2n+1, 2), read only) of a NACA designation digits"
+    coords = NacaCoords([digits], n, finiteTE, halfCosine)[0]
+    coords.setflags(write=False)
+    return coords
+
+def NacaFoil(name, n=sectionPoints, finiteTE=False, halfCosine=True):
+    "foil name and unit chord coords of a designation, as read from a dat file"
+    digits = Digits(name)
+    return f"NACA{digits}", NacaSection(digits, int(n), bool(finiteTE), bool(halfCosine))
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# *******************************************************************************
+# *  Ader workbench                                                             *
+# *    For more details see InitGui.py and the LICENCE text file.               *
+# *                                                                             *
+# *  Module : adrLibPack.py                                                     *
+# *    Airfoil pack : all foil coords compiled in one binary file               *
+# *     - header, name table (json), offset table, float64 coords blocks        *
+# *     - memory mapped loader, zero copy (N, 2) array view per foil            *
+# *                                                                             *
+# *  Dependencies :                                                             *
+# *    numpy (no FreeCAD import, usable outside the workbench)                  *
+# *                                                                             *
+# *  History :                                                                  *
+# *    2026-10-18 : initial release                                             *
+# *                                                                             *
+# *******************************************************************************
+
+__title__ = "Ader Workbench - airfoil pack"
+__author__ = "Claude GUTH"
+
+import os
+import json
+import mmap
+import struct
+import numpy as np
+
+# header : magic, version, count, name table offset/size, offset table offset, data offset
+packMagic = b'ADRPACK\0'
+packVersion = 1
+headerFormat = '<8sII4Q'
+headerSize = struct.calcsize(headerFormat)
+
+def PathKey(filename):
+    "normalized path used to find a foil in the pack"
+    return os.path.normcase(os.path.realpath(filename))
+
+def Align8(n):
+    return (n + 7) & ~7
+
+def CompilePack(filenames, packFile, parse):
+    """
+    Compile foil files in a pack file.
+    parse(filename) returns (title, coords) with unit chord coords.
+    Files that can't be parsed are skipped. Returns the number of foils packed.
+    """
+    names = []
+    blocks = []
+    for filename in filenames:
+        try:
+            st = os.stat(filename)
+            title, coords = parse(filename)
+        except (OSError, ValueError):
+            continue
+        coords = np.ascontiguousarray(coords, dtype='<f8').reshape(-1, 2)
+        names.append({'path': PathKey(filename), 'title': title,
+                      'size': st.st_size, 'mtime': st.st_mtime_ns})
+        blocks.append(coords)
+
+    count = len(names)
+    nameTable = json.dumps(names).encode('utf-8')
+    offsets = np.zeros((count, 2), dtype='<i8')     # first point, nb points
+    if count:
+        sizes = np.array([len(b) for b in blocks], dtype='<i8')
+        offsets[:, 1] = sizes
+        offsets[1:, 0] = np.cumsum(sizes)[:-1]
+    nameOffset = headerSize
+    offsetOffset = Align8(nameOffset + len(nameTable))
+    dataOffset = Align8(offsetOffset + offsets.nbytes)
+
+    tmpFile = packFile + '.tmp'
+    with open(tmpFile, 'wb') as f:
+        f.write(struct.pack(headerFormat, packMagic, packVersion, count,
+                            nameOffset, len(nameTable), offsetOffset, dataOffset))
+        f.write(nameTable)
+        f.write(b'\0' * (offsetOffset - nameOffset - len(nameTable)))
+        f.write(offsets.tobytes())
+        f.write(b'\0' * (dataOffset - offsetOffset - offsets.nbytes))
+        for b in blocks:
+            f.write(b.tobytes())
+    os.replace(tmpFile, packFile)
+    return count
+
+
+class FoilPack:
+    "Memory mapped airfoil pack, read only."
+
+    def __init__(self, packFile):
+        self.packFile = packFile
+        self.mtime = os.stat(packFile).st_mtime_ns
+        with open(packFile, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, nameOffset, nameSize, offsetOffset, dataOffset = \
+            struct.unpack_from(headerFormat, self.mm, 0)
+        if magic != packMagic or version != packVersion:
+            self.Close()
+            raise ValueError("Invalid foil pack : " + packFile)
+        self.names = json.loads(bytes(self.mm[nameOffset:nameOffset + nameSize]).decode('utf-8'))
+        self.offsets = np.frombuffer(self.mm, dtype='<i8', count=2*count, offset=offsetOffset).reshape(-1, 2)
+        total = int(self.offsets[:, 1].sum()) if count else 0
+        if total:
+            self.data = np.frombuffer(self.mm, dtype='<f8', count=2*total, offset=dataOffset).reshape(-1, 2)
+        else:
+            self.data = np.empty((0, 2))
+        self.index = {n['path']: i for i, n in enumerate(self.names)}
+
+    def Close(self):
+        "release the mapping (required before replacing the file on Windows)"
+        self.offsets = None
+        self.data = None
+        try:
+            self.mm.close()
+        except BufferError:
+            # views still referenced, released with them
+            pass
+
+    def IsStale(self):
+        "True if the pack file changed since it was loaded"
+        try:
+            return os.stat(self.packFile).st_mtime_ns != self.mtime
+        except OSError:
+            return True
+
+    def Coords(self, i):
+        "title and zero copy (N, 2) coords view of foil i"
+        first, nb = self.offsets[i]
+        return self.names[i]['title'], self.data[first:first + nb]
+
+    def Find(self, filename, st=None):
+        """
+        Foil index for a file, None if not in pack or not up to date.
+        st : os.stat result of the file if already known.
+        """
+        i = self.index.get(PathKey(filename))
+        if i is None:
+            return None
+        if st is None:
+            try:
+                st = os.stat(filename)
+            except OSError:
+                return None
+        n = self.names[i]
+        if n['size'] != st.st_size or n['mtime'] != st.st_mtime_ns:
+            return None
+        return i
+
+    def __len__(self):
+        return len(self.names)
+
+
+def LoadPack(packFile):
+    "pack from file, None if missing or invalid"
+    if not os.path.exists(packFile):
+        return None
+    try:
+        return FoilPack(packFile)
+    except (OSError, ValueError):
+        return None
@@ -9,6 +9,11 @@
 # *  Dependencies :                                                             *
 # *                                                                             *
 # *  History :                                                                  *
+# *    2026-10-18 : solid of revolution from a meridian B-spline, no sketch,    *
+# *                 Polyline points (adrLibGeom) accepted, bulk MakeSpline,     *
+# *                 lean sketches (B-spline only), promote to editable form,    *
+# *                 least squares fit to a tolerance, symmetric vectors of a    *
+# *                 half profile                                                *
 # *    2025-03-05 : initial release                                             *
 # *                                                                             *
 # *******************************************************************************
@@ -23,11 +28,35 @@ import Sketcher
 from math import sin, cos, sqrt, pi, radians
 import adrWBCommon as wb
 import adrLibPart
+import adrLibGeom
+import adrLibFit
+import numpy as np
 
 # debug messages handling
 localDebug = False
 # debug msg for this unit
 
+def Vectors(points):
+  "App.Vector list of a Polyline (adrLibGeom), other point lists unchanged"
+  if not isinstance(points, adrLibGeom.Polyline):
+    return points
+  vects = []
+  for x, y, z in points.Chunks():
+    vects.extend(map(App.Vector, x, y, z))
+  if points.closed:
+    vects.append(App.Vector(vects[0]))
+  return vects
+
+def SymmetricVectors(points, axis=1):
+  """
+  App.Vector list of a half profile (Polyline) from its last point to its
+  first, then mirrored back (first point not repeated) : no mirrored copy
+  """
+  vects = Vectors(points.Reversed())
+  for x, y, z in points.Chunks(start=1, mirror=axis):
+    vects.extend(map(App.Vector, x, y, z))
+  return vects
+
 def NewSketch(name='Sketch', plane='XY', body=None):
   if body == None:
     body=Gui.ActiveDocument.ActiveView.getActiveObject('pdbody')
@@ -50,47 +79,130 @@ def NewSketch(name='Sketch', plane='XY', body=None):
 
   return sk
 
-def MakeSpline(vects, name='skSpline', plane='XY', perodic=False, body=None, sk=None):
+def SplineGeometry(vects, perodic=False):
+  "degree 3 B-spline interpolating vects (knots at the points)"
+  bsp = Part.BSplineCurve()
+  bsp.interpolate(vects, PeriodicFlag=perodic)
+  bsp.increaseDegree(3)
+  return Part.BSplineCurve(bsp.getPoles(), bsp.getMultiplicities(), bsp.getKnots(), perodic, 3, None, False)
+
+def Points(vects):
+  "(N, 3) array of a Polyline (closed : first point repeated) or App.Vector list"
+  if isinstance(vects, adrLibGeom.Polyline):
+    xyz = vects.xyz
+    return np.vstack((xyz, xyz[:1])) if vects.closed else xyz
+  return np.array([(v.x, v.y, v.z) for v in vects], dtype=np.float64)
+
+def FitGeometry(vects, tolerance, fixed=()):
+  """
+  Degree 3 B-spline approximating vects within tolerance with the fewest
+  poles (adrLibFit), ends and points of index in fixed interpolated.
+  None if the tolerance can't be met.
+  """
+  points = Points(vects)
+  fit = adrLibFit.FitBSpline(points, tolerance, fixed)
+  if fit.deviation > tolerance:
+    wb.consoleMsg(wb.translate("Ader", "Spline fit : tolerance not met") +
+                  f" ({fit.deviation:.4f} mm), " + wb.translate("Ader", "points interpolated") + "\n")
+    return None
+  wb.consoleMsg(wb.translate("Ader", "Spline fit : ") +
+                f"{len(points)} points, {len(fit)} poles, max deviation {fit.deviation:.4f} mm\n")
+  return Part.BSplineCurve([App.Vector(*pole) for pole in fit.poles], fit.mults, list(fit.knots), False, fit.degree, None, False)
+
+def KnotVectors(geo):
+  "points of a B-spline at its knots (last knot of a periodic spline excluded)"
+  knots = geo.getKnots()
+  if geo.isPeriodic():
+    knots = knots[:-1]
+  return [geo.value(k) for k in knots]
+
+def FitTolerance(fit=None):
+  "spline fit tolerance (mm, 0 : interpolation), default from the Ader preferences"
+  return wb.FitTolerance() if fit is None else float(fit or 0)
+
+def IsLean(lean=None):
+  "lean sketch mode, default from the Ader preferences"
+  return wb.LeanSketches() if lean is None else bool(lean)
+
+def MakeSpline(vects, name='skSpline', plane='XY', perodic=False, body=None, sk=None, bulk=True, lean=None,
+               fit=None, fixed=()):
+  """
+  Sketch B-spline through vects, a construction point aligned on each knot.
+  bulk : geometries and constraints added as lists (2 geometry calls,
+  1 constraint call), else one call per point (previous behaviour, kept
+  for benchmarks).
+  lean : the B-spline only, no knot points, constraints nor poles (see
+  PromoteSketch), None : Ader preferences.
+  fit : least squares fit tolerance (mm), fewest poles, ends and points of
+  index in fixed interpolated, knot points on the fitted knots. 0 :
+  interpolation, None : Ader preferences. Periodic splines interpolated.
+  """
   doc=App.ActiveDocument
   if doc == None:
     raise Exception(wb.translate("Ader", "No active document")) 
   if sk == None:
     sk=NewSketch(name, plane, body)
+  tolerance=0 if perodic else FitTolerance(fit)
+  spline=FitGeometry(vects, tolerance, fixed) if tolerance > 0 else None
+  vects=Vectors(vects)
+  closed=vects[0] == vects[-1]
+  if spline == None:
+    spline=SplineGeometry(vects, perodic)
+  else:
+    vects=KnotVectors(spline)              # knot points on the fitted knots
   originIx=sk.GeometryCount                # get nb elements
   nb=len(vects)
- 
-  for vect in vects:
-    sk.addGeometry(Part.Point(vect),True)  # add nb elements
-
-  poles = []
-  knots = []
-  mults = []
-  bsps = []
-  bsps.append(Part.BSplineCurve())
-  bsps[-1].interpolate(vects, PeriodicFlag=perodic)
-  bsps[-1].increaseDegree(3)
-  poles.extend(bsps[-1].getPoles())
-  knots.extend(bsps[-1].getKnots())
-  mults.extend(bsps[-1].getMultiplicities())
-  sk.addGeometry(Part.BSplineCurve(poles,mults,knots,perodic,3,None,False),False)
+  if IsLean(lean):
+    sk.addGeometry(spline, False)
+    return sk
   splineIx= originIx + nb
-  del(bsps)
-  del(poles)
-  del(knots)
-  del(mults)
-
-  conList = []
-  for i in range(0, nb):
-    constraint = Sketcher.Constraint('InternalAlignment:Sketcher::BSplineKnotPoint', i+originIx, 1, splineIx, i)
-    conList.append(constraint) 
-  if vects[0] == vects[-1]:
-    conList.append(Sketcher.Constraint('Coincident', originIx+nb-1, 1, 0, 1))
+
+  if bulk:
+    sk.addGeometry([Part.Point(vect) for vect in vects], True)
+    sk.addGeometry(spline, False)
+  else:
+    for vect in vects:
+      sk.addGeometry(Part.Point(vect),True)  # add nb elements
+    sk.addGeometry(spline,False)
+
+  conList = [Sketcher.Constraint('InternalAlignment:Sketcher::BSplineKnotPoint', i+originIx, 1, splineIx, i)
+             for i in range(0, nb)]
+  if closed:
+    conList.append(Sketcher.Constraint('Coincident', originIx+nb-1, 1, originIx, 1))
   sk.addConstraint(conList)
   del conList
   sk.exposeInternalGeometry(splineIx)
 
   return sk
 
+def IsPromoted(sk, splineIx):
+  "True if knot points are aligned on the B-spline splineIx"
+  for c in sk.Constraints:
+    if c.Type == 'InternalAlignment' and c.Second == splineIx and sk.Geometry[c.First].TypeId == 'Part::GeomPoint':
+      return True
+  return False
+
+def PromoteSpline(sk, splineIx):
+  "editable form of a lean B-spline : knot points aligned, poles exposed"
+  geo = sk.Geometry[splineIx]
+  vects = KnotVectors(geo)
+  originIx = sk.GeometryCount
+  sk.addGeometry([Part.Point(vect) for vect in vects], True)
+  conList = [Sketcher.Constraint('InternalAlignment:Sketcher::BSplineKnotPoint', originIx+i, 1, splineIx, i)
+             for i in range(len(vects))]
+  if not geo.isPeriodic() and vects[0] == vects[-1]:
+    conList.append(Sketcher.Constraint('Coincident', originIx+len(vects)-1, 1, originIx, 1))
+  sk.addConstraint(conList)
+  sk.exposeInternalGeometry(splineIx)
+
+def PromoteSketch(sk):
+  "promote the lean B-splines of a sketch, returns the number of splines promoted"
+  splines = [i for i, geo in enumerate(sk.Geometry)
+             if geo.TypeId == 'Part::GeomBSplineCurve' and not sk.getConstruction(i) and not IsPromoted(sk, i)]
+  for splineIx in splines:
+    PromoteSpline(sk, splineIx)
+  return len(splines)
+
 def MakePad(sketch, length, name= 'Pad', reversed=0, midplane=0, offset=0):
   body=Gui.ActiveDocument.ActiveView.getActiveObject('pdbody')
   if body == None:
@@ -122,6 +234,33 @@ def MakeRevolution(sketch, angle, name= 'Revolution', reversed=0, midplane=0):
   rev.Reversed = reversed
   rev.Type = 0
 
+def RevolutionShape(vects, angle=360.0):
+  """
+  Solid of revolution around X of a meridian (vects in the XY plane, y >= 0,
+  from nose to tail) : one interpolated B-spline closed by a line, the face
+  revolved by angle (degrees). No sketch, no solver.
+  """
+  vects = Vectors(vects)
+  if len(vects) < 3:
+    raise ValueError(wb.translate("Ader", "Not enough points"))
+  bsp = Part.BSplineCurve()
+  bsp.interpolate(vects)
+  edges = [bsp.toShape()]
+  if (vects[-1] - vects[0]).Length > 1e-9:
+    edges.append(Part.makeLine(vects[-1], vects[0]))
+  face = Part.Face(Part.Wire(edges))
+  return face.revolve(App.Vector(0, 0, 0), App.Vector(1, 0, 0), angle)
+
+def MakeRevolutionFeature(vects, angle=360.0, name='Revolution', doc=None):
+  "solid of revolution of a meridian (see RevolutionShape) in one Part::Feature"
+  if doc == None:
+    doc=App.ActiveDocument
+  if doc == None:
+    raise Exception(wb.translate("Ader", "No active document")) 
+  feature = doc.addObject('Part::Feature', name)
+  feature.Shape = RevolutionShape(vects, angle)
+  return feature
+
 def MakeIntersectionPlanes(nbPlanes=8, body=None):
   doc=App.ActiveDocument
   if doc == None:
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# *******************************************************************************
+# *  Ader workbench                                                             *
+# *    For more details see InitGui.py and the LICENCE text file.               *
+# *                                                                             *
+# *  Module : adrLibRepanel.py                                                  *
+# *    Airfoil repaneling : the foil outline is refitted (parametric cubic      *
+# *    spline over arc length) and resampled to a target point count            *
+# *     - cosine spacing on each side (points clustered at LE and TE)           *
+# *     - curvature adaptive spacing                                            *
+# *     - max deviation from the original points capped : points are added     *
+# *       until the tolerance is met                                            *
+# *                                                                             *
+# *  Dependencies :                                                             *
+# *    numpy, adrLibSpline (no FreeCAD import)                                  *
+# *                                                                             *
+# *  History :                                                                  *
+# *    2026-10-18 : initial release                                             *
+# *                                                                             *
+# *******************************************************************************
+
+__title__ = "Ader Workbench - airfoil repaneling"
+__author__ = "Claude GUTH"
+
+import numpy as np
+import adrLibSpline
+
+# spacings
+spacingCosine = 'cosine'
+spacingCurvature = 'curvature'
+spacings = [spacingCosine, spacingCurvature]
+
+# max deviation from the original points, relative to chord
+defaultTolerance = 1e-3
+
+# samples per original segment (leading edge search, curvature, deviation)
+densify = 10
+
+def RemoveDuplicates(coords):
+    "coords without consecutive duplicated points (null spline intervals)"
+    keep = np.ones(len(coords), dtype=bool)
+    keep[1:] = np.hypot(*np.diff(coords, axis=0).T) > 1e-12
+    return coords[keep]
+
+def ArcLength(coords):
+    "cumulative chord length parameter of a polyline"
+    return np.concatenate(([0.0], np.cumsum(np.hypot(*np.diff(coords, axis=0).T))))
+
+class FoilSpline:
+    "parametric cubic spline through foil coords ((N, 2), Selig order)"
+
+    def __init__(self, coords):
+        self.coords = RemoveDuplicates(np.asarray(coords, dtype=np.float64)[:, :2])
+        if len(self.coords) < 4:
+            raise ValueError("Not enough points")
+        self.t = ArcLength(self.coords)
+        self.spline = adrLibSpline.CubicSpline(self.t, self.coords)
+        self.length = self.t[-1]
+        self.chord = np.ptp(self.coords[:, 0]) or 1.0
+        self.tDense = np.linspace(0, self.length, densify*len(self.coords))
+        self.tLe = self.LeadingEdge()
+
+    def __call__(self, tq, derivative=0):
+        return self.spline(tq, derivative)
+
+    def LeadingEdge(self):
+        "parameter of the min x point of the spline"
+        x = self(self.tDense)[:, 0]
+        i = int(np.argmin(x))
+        # local refinement around the dense minimum
+        lo, hi = self.tDense[max(i - 1, 0)], self.tDense[min(i + 1, len(self.tDense) - 1)]
+        tFine = np.linspace(lo, hi, 201)
+        return float(tFine[np.argmin(self(tFine)[:, 0])])
+
+    def Curvature(self, tq):
+        d1 = self(tq, 1)
+        d2 = self(tq, 2)
+        return np.abs(d1[:, 0]*d2[:, 1] - d1[:, 1]*d2[:, 0]) / np.maximum(np.hypot(*d1.T)**3, 1e-30)
+
+    def Stations(self, nbPoints, spacing=spacingCosine):
+        "spline parameters of nbPoints, LE included, sides from TE to LE to TE"
+        nbUpper = nbPoints//2 + 1
+        nbLower = nbPoints - nbUpper + 1
+        sides = ((0.0, self.tLe, nbUpper), (self.tLe, self.length, nbLower))
+        if spacing == spacingCosine:
+            parts = [t0 + (t1 - t0)*0.5*(1 - np.cos(np.linspace(0, np.pi, n))) for t0, t1, n in sides]
+        elif spacing == spacingCurvature:
+            parts = [self.CurvatureStations(t0, t1, n) for t0, t1, n in sides]
+        else:
+            raise ValueError(f"Unknown spacing : {spacing}")
+        return np.concatenate((parts[0], parts[1][1:]))
+
+    def CurvatureStations(self, t0, t1, n):
+        "n parameters from t0 to t1, density growing as sqrt(1 + chord * curvature)"
+        td = np.linspace(t0, t1, max(densify*n, 200))
+        w = np.sqrt(1 + self.chord*self.Curvature(td))
+        cw = np.concatenate(([0.0], np.cumsum(0.5*(w[1:] + w[:-1])*np.diff(td))))
+        return np.interp(np.linspace(0, cw[-1], n), cw, td)
+
+
+def Deviation(original, coords):
+    "max distance of the original points to the spline through coords"
+    spline = FoilSpline(coords)
+    dense = spline(spline.tDense)
+    a, b = dense[:-1], dense[1:]
+    ab = b - a
+    ab2 = np.maximum((ab**2).sum(axis=1), 1e-30)
+    p = np.asarray(original, dtype=np.float64)[:, None, :2]
+    u = np.clip(((p - a)*ab).sum(axis=2) / ab2, 0, 1)
+    d = np.hypot(*(a + u[..., None]*ab - p).transpose(2, 0, 1))
+    return float(d.min(axis=1).max())
+
+def Repanel(coords, nbPoints, spacing=spacingCosine, tolerance=defaultTolerance, maxPoints=None):
+    """
+    Foil coords ((N, 2), Selig order) resampled to nbPoints.
+    Points are added while the max deviation from the original points
+    exceeds tolerance (relative to chord, None : no check), up to maxPoints
+    (default : the original point count).
+    A closed trailing edge stays closed.
+    """
+    coords = np.asarray(coords, dtype=np.float64)[:, :2]
+    spline = FoilSpline(coords)
+    closed = np.allclose(coords[0], coords[-1])
+    n = max(int(nbPoints), 5)
+    maxPoints = max(n, maxPoints or len(coords))
+    while True:
+        new = spline(spline.Stations(n, spacing))
+        if closed:
+            new[-1] = new[0]
+        if tolerance is None or n >= maxPoints:
+            return new
+        if Deviation(coords, new) <= tolerance*spline.chord:
+            return new
+        n = min(int(n*1.25) + 1, maxPoints)
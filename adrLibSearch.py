@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+# *******************************************************************************
+# *  Ader workbench                                                             *
+# *    For more details see InitGui.py and the LICENCE text file.               *
+# *                                                                             *
+# *  Module : adrLibSearch.py                                                   *
+# *    Search index of the foil library in an SQLite database                   *
+# *     - full text (FTS5) on file name and title                               *
+# *     - numeric columns (thickness, camber, points...) for range queries      *
+# *     - synced incrementally with the catalog and the analysis results        *
+# *                                                                             *
+# *  Dependencies :                                                             *
+# *    sqlite3 with FTS5, adrLibAnalysis (no FreeCAD import)                    *
+# *                                                                             *
+# *  History :                                                                  *
+# *    2026-10-18 : initial release                                             *
+# *    2026-10-18 : strict bounds for < and >                                   *
+# *                                                                             *
+# *******************************************************************************
+
+__title__ = "Ader Workbench - foil search"
+__author__ = "Claude GUTH"
+
+import os
+import re
+import sqlite3
+import threading
+import adrLibAnalysis
+
+# database schema version, increase to force a rebuild
+searchVersion = 2
+
+# numeric columns, metrics of adrLibAnalysis
+numericColumns = [m[0] for m in adrLibAnalysis.metrics]
+
+# range condition in a query text : thickness>12%, points<=100, camber=2%..4%
+rangePattern = re.compile(r'^(\w+)(<=|>=|<|>|=)([-+]?[\d.]+%?)(?:\.\.([-+]?[\d.]+%?))?$')
+
+def TrigramAvailable():
+    "FTS5 trigram tokenizer (SQLite 3.34+) : substring search, as the panel filter did"
+    try:
+        sqlite3.connect(':memory:').execute("CREATE VIRTUAL TABLE t USING fts5(a, tokenize='trigram')")
+    except sqlite3.Error:
+        return False
+    return True
+
+def ParseValue(text):
+    "float, '12%' gives 0.12"
+    if text.endswith('%'):
+        return float(text[:-1]) / 100
+    return float(text)
+
+def ParseQuery(text):
+    """
+    Split a search text into words and range conditions.
+    Ranges : column op value, op in < <= > >= =, or column=min..max,
+    values in % are relative to chord. Column names are case insensitive.
+    Returns (words, [(column, min, max, strict)]), strict for < and >.
+    """
+    columns = {c.lower(): c for c in numericColumns}
+    words, ranges = [], []
+    for token in text.split():
+        m = rangePattern.match(token)
+        column = columns.get(m.group(1).lower()) if m else None
+        if column is None:
+            words.append(token)
+            continue
+        try:
+            value = ParseValue(m.group(3))
+            high = ParseValue(m.group(4)) if m.group(4) else None
+        except ValueError:
+            words.append(token)
+            continue
+        op = m.group(2)
+        strict = op in ('<', '>')
+        if high is not None:
+            ranges.append((column, value, high, False))
+        elif op in ('<', '<='):
+            ranges.append((column, None, value, strict))
+        elif op in ('>', '>='):
+            ranges.append((column, value, None, strict))
+        else:
+            ranges.append((column, value, value, False))
+    return words, ranges
+
+
+class FoilSearch:
+    """
+    Foil search database, one row per catalog entry, keyed by full path.
+    Each thread gets its own connection (WAL : searches while syncing).
+    """
+
+    def __init__(self, dbFile):
+        self.dbFile = dbFile
+        self.local = threading.local()
+        self.trigram = TrigramAvailable()
+        self.Create()
+
+    def Connection(self):
+        con = getattr(self.local, 'con', None)
+        if con is None:
+            con = sqlite3.connect(self.dbFile)
+            con.row_factory = sqlite3.Row
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+            self.local.con = con
+        return con
+
+    def Create(self):
+        "create tables, dropped first if from an other version"
+        con = self.Connection()
+        version = con.execute("PRAGMA user_version").fetchone()[0]
+        if version == searchVersion:
+            return
+        metricColumns = ''.join(f", {c} REAL" for c in numericColumns if c != 'points')
+        tokenize = 'trigram' if self.trigram else 'unicode61'
+        with con:
+            con.executescript(f"""
+                DROP TABLE IF EXISTS foils_fts;
+                DROP TABLE IF EXISTS foils;
+                CREATE TABLE foils (
+                    id INTEGER PRIMARY KEY,
+                    path TEXT UNIQUE, file TEXT, folder TEXT, title TEXT,
+                    dialect TEXT, size INTEGER, mtime REAL, analyzed INTEGER,
+                    points INTEGER{metricColumns});
+                CREATE VIRTUAL TABLE foils_fts USING fts5(
+                    file, title, content='foils', content_rowid='id', tokenize='{tokenize}');
+                CREATE TRIGGER foils_ai AFTER INSERT ON foils BEGIN
+                    INSERT INTO foils_fts(rowid, file, title) VALUES (new.id, new.file, new.title);
+                END;
+                CREATE TRIGGER foils_ad AFTER DELETE ON foils BEGIN
+                    INSERT INTO foils_fts(foils_fts, rowid, file, title) VALUES ('delete', old.id, old.file, old.title);
+                END;
+            """)
+            for c in numericColumns:
+                con.execute(f"CREATE INDEX foils_{c} ON foils({c})")
+            # ORDER BY file : rows read in order, a LIMIT stops the scan
+            con.execute("CREATE INDEX foils_file ON foils(file COLLATE NOCASE)")
+            con.execute(f"PRAGMA user_version={searchVersion}")
+
+    def Sync(self, entries, metrics=None):
+        """
+        Sync the database with catalog entries, metrics(entry) returns the
+        analysis results of an entry or None. Only new, changed or newly
+        analyzed entries are written. Returns the number of rows written.
+        """
+        con = self.Connection()
+        known = {r['path']: (r['size'], r['mtime'], r['analyzed'])
+                 for r in con.execute("SELECT path, size, mtime, analyzed FROM foils")}
+        columns = ['path', 'file', 'folder', 'title', 'dialect', 'size', 'mtime', 'analyzed'] + numericColumns
+        rows, paths = [], set()
+        for e in entries:
+            path = os.path.join(e['folder'], e['file'])
+            paths.add(path)
+            r = metrics(e) if metrics else None
+            k = known.get(path)
+            if k and k[0] == e['size'] and k[1] == e['mtime'] and (k[2] or r is None):
+                continue
+            r = r or {}
+            values = [path, e['file'], e['folder'], e['title'], e.get('dialect'), e['size'], e['mtime'], int(bool(r))]
+            values += [e.get('points') if c == 'points' else r.get(c) for c in numericColumns]
+            rows.append(values)
+        removed = [(p,) for p in known if p not in paths]
+        if rows or removed:
+            with con:
+                con.executemany("DELETE FROM foils WHERE path=?", removed + [(v[0],) for v in rows])
+                con.executemany(f"INSERT INTO foils({', '.join(columns)}) VALUES ({', '.join('?'*len(columns))})", rows)
+        return len(rows)
+
+    def Search(self, text='', ranges=None, limit=None):
+        """
+        Foils matching all words of text (file name or title, case insensitive
+        substrings) and the range conditions of text and ranges
+        ([(column, min, max)], None for an open bound, bounds included, an
+        optional 4th item True excludes them).
+        Returns dicts with the foils table columns, sorted by file name.
+        """
+        words, textRanges = ParseQuery(text or '')
+        ranges = textRanges + list(ranges or [])
+        where, params = [], []
+        ftsWords = [w for w in words if len(w) >= 3] if self.trigram else words
+        if ftsWords:
+            quoted = ['"' + w.replace('"', '""') + '"' + ('' if self.trigram else '*') for w in ftsWords]
+            where.append("id IN (SELECT rowid FROM foils_fts WHERE foils_fts MATCH ?)")
+            params.append(' '.join(quoted))
+        for w in words:
+            if w in ftsWords:
+                continue
+            # too short for trigrams
+            pattern = '%' + w.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            where.append("(file LIKE ? ESCAPE '\\' OR title LIKE ? ESCAPE '\\')")
+            params += [pattern, pattern]
+        for r in ranges:
+            column, low, high = r[:3]
+            strict = len(r) > 3 and r[3]
+            if column not in numericColumns:
+                raise ValueError(f"Unknown column : {column}")
+            if low is not None:
+                where.append(f"{column} {'>' if strict else '>='} ?")
+                params.append(low)
+            if high is not None:
+                where.append(f"{column} {'<' if strict else '<='} ?")
+                params.append(high)
+        sql = "SELECT * FROM foils"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY file COLLATE NOCASE"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return [dict(r) for r in self.Connection().execute(sql, params)]
+
+    def Paths(self, text='', ranges=None):
+        "full paths of the foils matching text and ranges"
+        return [r['path'] for r in self.Search(text, ranges)]
+
+    def __len__(self):
+        return self.Connection().execute("SELECT COUNT(*) FROM foils").fetchone()[0]
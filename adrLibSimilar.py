@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# *******************************************************************************
+# *  Ader workbench                                                             *
+# *    For more details see InitGui.py and the LICENCE text file.               *
+# *                                                                             *
+# *  Module : adrLibSimilar.py                                                  *
+# *    Shape similarity search over the foil library                            *
+# *     - feature vector : upper / lower sides resampled at fixed stations      *
+# *     - optional PCA reduction                                                *
+# *     - k nearest neighbours : scipy KD-tree if available, numpy otherwise    *
+# *     - persisted, rebuilt incrementally with the catalog                     *
+# *                                                                             *
+# *  Dependencies :                                                             *
+# *    numpy, adrLibDat, adrLibAnalysis, scipy (optional)                       *
+# *                                                                             *
+# *  History :                                                                  *
+# *    2026-10-18 : initial release                                             *
+# *                                                                             *
+# *******************************************************************************
+
+__title__ = "Ader Workbench - foil similarity search"
+__author__ = "Claude GUTH"
+
+import os
+import numpy as np
+import adrLibDat
+import adrLibAnalysis
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+# feature file format version, increase to force a full rebuild
+featuresVersion = 1
+
+# stations per side (cosine spacing, LE and TE excluded)
+nbFeatureStations = 32
+featureStations = 0.5*(1 - np.cos(np.linspace(0, np.pi, nbFeatureStations + 2)[1:-1]))
+
+def NormalizeCoords(coords):
+    """
+    Unit chord coords, leading edge at origin and chord along x :
+    removes chord, setting and position of a sketch or scaled foil.
+    """
+    coords = np.asarray(coords, dtype=np.float64)[:, :2]
+    te = 0.5*(coords[0] + coords[-1])
+    ile = int(np.argmax(((coords - te)**2).sum(axis=1)))
+    le = coords[ile]
+    chord = te - le
+    length = np.hypot(*chord)
+    if length <= 0:
+        raise ValueError("Null chord")
+    c, s = chord / length
+    rot = np.array([[c, -s], [s, c]])
+    return (coords - le) @ rot / length
+
+def FeatureVector(coords):
+    "upper then lower side y at the feature stations"
+    upper, lower = adrLibAnalysis.SplitSides(NormalizeCoords(coords))
+    return np.concatenate((adrLibAnalysis.SideAt(upper, featureStations),
+                           adrLibAnalysis.SideAt(lower, featureStations)))
+
+def FileFeatures(filename):
+    "feature vector of a foil file, None if it can't be read"
+    try:
+        title, coords = adrLibDat.ReadDat(filename)
+        return FeatureVector(coords)
+    except (OSError, ValueError):
+        return None
+
+
+class FoilIndex:
+    """
+    Nearest neighbours index of the catalog foils.
+    Features are keyed by full path, valid while size and mtime don't change.
+    """
+
+    def __init__(self, indexFile=None, components=16):
+        self.indexFile = indexFile
+        self.components = components       # PCA components, 0 : no reduction
+        self.paths = []
+        self.sizes = np.zeros(0, dtype=np.int64)
+        self.mtimes = np.zeros(0)
+        self.features = np.zeros((0, 2*nbFeatureStations))
+        self.tree = None
+        self.Load()
+
+    def Load(self):
+        if not self.indexFile or not os.path.exists(self.indexFile):
+            return False
+        try:
+            with np.load(self.indexFile, allow_pickle=False) as data:
+                if int(data['version']) != featuresVersion:
+                    return False
+                self.paths = list(data['paths'])
+                self.sizes = data['sizes']
+                self.mtimes = data['mtimes']
+                self.features = data['features']
+        except (OSError, ValueError, KeyError):
+            return False
+        self.Build()
+        return True
+
+    def Save(self):
+        if not self.indexFile:
+            return False
+        tmpFile = self.indexFile + '.tmp.npz'
+        try:
+            np.savez(tmpFile, version=featuresVersion, paths=np.array(self.paths, dtype=str),
+                     sizes=self.sizes, mtimes=self.mtimes, features=self.features)
+            os.replace(tmpFile, self.indexFile)
+        except OSError:
+            return False
+        return True
+
+    def Update(self, entries, workers=None, save=True):
+        """
+        Sync the index with catalog entries : features are computed only for
+        new or changed files (on a process pool). Returns the number computed.
+        """
+        old = {p: i for i, p in enumerate(self.paths)}
+        paths, sizes, mtimes, rows, todo = [], [], [], [], []
+        for e in entries:
+            path = os.path.join(e['folder'], e['file'])
+            i = old.get(path)
+            if i is not None and self.sizes[i] == e['size'] and self.mtimes[i] == e['mtime']:
+                rows.append(self.features[i])
+            else:
+                todo.append(len(paths))
+                rows.append(None)
+            paths.append(path)
+            sizes.append(e['size'])
+            mtimes.append(e['mtime'])
+
+        computed = adrLibAnalysis.PoolMap(FileFeatures, [paths[i] for i in todo], workers)
+        for i, f in zip(todo, computed):
+            rows[i] = f
+
+        # unreadable files are not indexed
+        keep = [i for i, f in enumerate(rows) if f is not None]
+        changed = len(todo) > 0 or len(keep) != len(self.paths)
+        self.paths = [paths[i] for i in keep]
+        self.sizes = np.array([sizes[i] for i in keep], dtype=np.int64)
+        self.mtimes = np.array([mtimes[i] for i in keep], dtype=np.float64)
+        self.features = np.array([rows[i] for i in keep]).reshape(-1, 2*nbFeatureStations)
+        if changed:
+            self.Build()
+            if save:
+                self.Save()
+        return len(todo)
+
+    def Build(self):
+        "PCA basis and search tree"
+        self.mean = self.features.mean(axis=0) if len(self.features) else np.zeros(2*nbFeatureStations)
+        self.basis = None
+        if self.components and len(self.features) > self.components:
+            u, s, vt = np.linalg.svd(self.features - self.mean, full_matrices=False)
+            self.basis = vt[:self.components].T
+        self.points = self.Project(self.features)
+        self.tree = cKDTree(self.points) if cKDTree is not None and len(self.points) else None
+
+    def Project(self, features):
+        centered = np.atleast_2d(features) - self.mean
+        return centered @ self.basis if self.basis is not None else centered
+
+    def Nearest(self, features, k=10):
+        "k nearest foils : list of (path, distance), closest first"
+        k = min(k, len(self.paths))
+        if k == 0:
+            return []
+        q = self.Project(features)[0]
+        if self.tree is not None:
+            dist, idx = self.tree.query(q, k=k)
+            dist, idx = np.atleast_1d(dist), np.atleast_1d(idx)
+        else:
+            d2 = ((self.points - q)**2).sum(axis=1)
+            idx = np.argpartition(d2, k - 1)[:k]
+            idx = idx[np.argsort(d2[idx])]
+            dist = np.sqrt(d2[idx])
+        return [(self.paths[i], float(d)) for i, d in zip(idx, dist)]
+
+    def Similar(self, coords, k=10):
+        "k foils nearest to coords ((N, 2), any chord, setting or position)"
+        return self.Nearest(FeatureVector(coords), k)
+
+    def __len__(self):
+        return len(self.paths)
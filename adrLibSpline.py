@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# *******************************************************************************
+# *  Ader workbench                                                             *
+# *    For more details see InitGui.py and the LICENCE text file.               *
+# *                                                                             *
+# *  Module : adrLibSpline.py                                                   *
+# *    Natural cubic spline, factored once, evaluated on arrays                 *
+# *     - second derivatives computed at construction                           *
+# *     - any number of query points at once (searchsorted)                     *
+# *     - value, 1st and 2nd derivatives                                        *
+# *     - extrapolation policies                                                *
+# *                                                                             *
+# *  Dependencies :                                                             *
+# *    numpy (no FreeCAD import)                                                *
+# *                                                                             *
+# *  History :                                                                  *
+# *    2026-10-18 : initial release                                             *
+# *                                                                             *
+# *******************************************************************************
+
+__title__ = "Ader Workbench - cubic spline"
+__author__ = "Claude GUTH"
+
+import numpy as np
+
+# extrapolation policies, outside [x0, xn]
+extrapolateCubic = 'cubic'      # end interval polynomial
+extrapolateLinear = 'linear'    # end tangent
+extrapolateClamp = 'clamp'      # end value
+extrapolateNan = 'nan'          # nan
+extrapolateRaise = 'raise'      # ValueError
+extrapolations = [extrapolateCubic, extrapolateLinear, extrapolateClamp, extrapolateNan, extrapolateRaise]
+
+def SecondDerivatives(x, y):
+    """
+    Second derivatives of the natural cubic spline through (x, y),
+    y (N,) or (N, k) : tridiagonal system (Thomas algorithm).
+    """
+    n = len(x)
+    h = np.diff(x)
+    y2 = y.reshape(n, -1)
+    m = np.zeros_like(y2)
+    if n < 3:
+        return m.reshape(y.shape)
+    r = 6*((y2[2:] - y2[1:-1]) / h[1:, None] - (y2[1:-1] - y2[:-2]) / h[:-1, None])
+    d = 2*(h[:-1] + h[1:])
+    c = h[1:-1]
+    for i in range(1, n - 2):
+        w = h[i] / d[i - 1]
+        d[i] -= w*c[i - 1]
+        r[i] -= w*r[i - 1]
+    inner = np.zeros_like(r)
+    inner[-1] = r[-1] / d[-1]
+    for i in range(n - 4, -1, -1):
+        inner[i] = (r[i] - c[i]*inner[i + 1]) / d[i]
+    m[1:-1] = inner
+    return m.reshape(y.shape)
+
+
+class CubicSpline:
+    """
+    Natural cubic spline through (x, y), x strictly increasing,
+    y (N,) or (N, k) for parametric curves.
+
+        spline = CubicSpline(x, y)
+        spline(xq)                  values
+        spline(xq, derivative=1)    slopes
+    """
+
+    def __init__(self, x, y, extrapolate=extrapolateCubic):
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        if len(self.x) < 2 or len(self.x) != len(self.y):
+            raise ValueError("Spline needs at least 2 points, as many x as y")
+        if np.any(np.diff(self.x) <= 0):
+            raise ValueError("Spline x must be strictly increasing")
+        if extrapolate not in extrapolations:
+            raise ValueError(f"Unknown extrapolation : {extrapolate}")
+        self.extrapolate = extrapolate
+        self.m = SecondDerivatives(self.x, self.y)
+
+    def __call__(self, xq, derivative=0, extrapolate=None):
+        "values (or derivatives 1, 2) at xq, scalar or array"
+        policy = extrapolate or self.extrapolate
+        xq = np.asarray(xq, dtype=np.float64)
+        scalar = xq.ndim == 0
+        xq = np.atleast_1d(xq)
+        x0, x1 = self.x[0], self.x[-1]
+        outside = (xq < x0) | (xq > x1)
+        if policy == extrapolateRaise and outside.any():
+            raise ValueError("Spline evaluated outside its range")
+        xe = np.clip(xq, x0, x1) if policy in (extrapolateLinear, extrapolateClamp) else xq
+        result = self.Eval(xe, derivative)
+        if outside.any() and policy != extrapolateCubic:
+            result = self.Outside(xq, xe, result, outside, derivative, policy)
+        return result[0] if scalar else result
+
+    def Eval(self, xq, derivative=0):
+        "polynomial of the interval of each xq (end intervals outside)"
+        x, y, m = self.x, self.y, self.m
+        i = np.clip(np.searchsorted(x, xq, side='right') - 1, 0, len(x) - 2)
+        h = x[i + 1] - x[i]
+        a = (x[i + 1] - xq) / h
+        b = (xq - x[i]) / h
+        if y.ndim > 1:
+            a, b, h = a[:, None], b[:, None], h[:, None]
+        y0, y1, m0, m1 = y[i], y[i + 1], m[i], m[i + 1]
+        if derivative == 0:
+            return a*y0 + b*y1 + ((a**3 - a)*m0 + (b**3 - b)*m1)*h*h/6
+        if derivative == 1:
+            return (y1 - y0)/h + ((1 - 3*a*a)*m0 + (3*b*b - 1)*m1)*h/6
+        if derivative == 2:
+            return a*m0 + b*m1
+        raise ValueError(f"Derivative order not handled : {derivative}")
+
+    def Outside(self, xq, xe, result, outside, derivative, policy):
+        "apply linear, clamp or nan policy to the points outside the range"
+        result = np.array(result)
+        if policy == extrapolateNan:
+            result[outside] = np.nan
+        elif policy == extrapolateClamp:
+            if derivative:
+                result[outside] = 0.0
+        elif policy == extrapolateLinear:
+            if derivative == 0:
+                slope = self.Eval(xe[outside], 1)
+                dx = xq[outside] - xe[outside]
+                result[outside] += slope*(dx[:, None] if self.y.ndim > 1 else dx)
+            elif derivative == 2:
+                result[outside] = 0.0
+        return result
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# *******************************************************************************
+# *  Ader workbench                                                             *
+# *    For more details see InitGui.py and the LICENCE text file.               *
+# *                                                                             *
+# *  Module : adrLibThumbs.py                                                   *
+# *    Airfoil outline thumbnails                                               *
+# *     - rendered with QPainter on a QImage, outside the GUI thread            *
+# *     - disk cache keyed by file content hash, LRU eviction                   *
+# *     - loader : background thread, last requested first, Qt signal when     *
+# *       a thumbnail is ready                                                  *
+# *                                                                             *
+# *  Dependencies :                                                             *
+# *    PySide (QtCore, QtGui), adrLibDat (no FreeCAD import)                    *
+# *                                                                             *
+# *  History :                                                                  *
+# *    2026-10-18 : initial release                                             *
+# *                                                                             *
+# *******************************************************************************
+
+__title__ = "Ader Workbench - airfoil thumbnails"
+__author__ = "Claude GUTH"
+
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from PySide import QtCore
+from PySide import QtGui
+import adrLibDat
+
+# thumbnail size (pixels) and drawing
+thumbWidth = 72
+thumbHeight = 24
+thumbMargin = 2
+outlineColor = (40, 40, 40)
+fillColor = (160, 190, 230)
+
+# increase to invalidate the cached thumbnails (drawing changed)
+thumbVersion = 1
+
+def RenderThumb(coords, width=thumbWidth, height=thumbHeight):
+    "outline of coords ((N, 2)) scaled to fit a transparent QImage"
+    image = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.transparent)
+    xMin, yMin = coords.min(axis=0)
+    xMax, yMax = coords.max(axis=0)
+    dx, dy = max(xMax - xMin, 1e-9), max(yMax - yMin, 1e-9)
+    scale = min((width - 2*thumbMargin) / dx, (height - 2*thumbMargin) / dy)
+    x0 = 0.5*(width - scale*dx) - scale*xMin
+    y0 = 0.5*(height + scale*dy) + scale*yMin
+    polygon = QtGui.QPolygonF([QtCore.QPointF(x0 + scale*x, y0 - scale*y) for x, y in coords])
+    painter = QtGui.QPainter(image)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing)
+    painter.setPen(QtGui.QPen(QtGui.QColor(*outlineColor), 1))
+    painter.setBrush(QtGui.QColor(*fillColor))
+    painter.drawPolygon(polygon)
+    painter.end()
+    return image
+
+
+class ThumbCache:
+    """
+    Thumbnails of foil files as png files in a folder, named by the hash of
+    the foil file content. At most maxFiles are kept, least recently used
+    removed first (file mtime is the last use).
+    """
+
+    def __init__(self, folder, maxFiles=5000):
+        self.folder = folder
+        self.maxFiles = maxFiles
+        self.lock = threading.Lock()
+        self.files = OrderedDict()      # key -> None, least recently used first
+        self.Scan()
+
+    def Scan(self):
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            found = [(de.stat().st_mtime, de.name[:-4]) for de in os.scandir(self.folder)
+                     if de.name.endswith('.png')]
+        except OSError:
+            found = []
+        with self.lock:
+            self.files = OrderedDict((key, None) for mtime, key in sorted(found))
+
+    def Key(self, raw):
+        "cache key of a foil file content"
+        h = hashlib.sha1(raw)
+        h.update(f"{thumbVersion} {thumbWidth}x{thumbHeight}".encode())
+        return h.hexdigest()
+
+    def FileName(self, key):
+        return os.path.join(self.folder, key + '.png')
+
+    def Get(self, key):
+        "cached QImage, None if not cached"
+        with self.lock:
+            if key not in self.files:
+                return None
+            self.files.move_to_end(key)
+        filename = self.FileName(key)
+        image = QtGui.QImage(filename)
+        if image.isNull():
+            with self.lock:
+                self.files.pop(key, None)
+            return None
+        try:
+            os.utime(filename)
+        except OSError:
+            pass
+        return image
+
+    def Put(self, key, image):
+        if not image.save(self.FileName(key), 'PNG'):
+            return
+        with self.lock:
+            self.files[key] = None
+            self.files.move_to_end(key)
+            evicted = []
+            while len(self.files) > self.maxFiles:
+                evicted.append(self.files.popitem(last=False)[0])
+        for key in evicted:
+            try:
+                os.remove(self.FileName(key))
+            except OSError:
+                pass
+
+    def Thumb(self, filename):
+        "QImage of a foil file, rendered and cached if required"
+        with open(filename, 'rb') as f:
+            raw = f.read()
+        key = self.Key(raw)
+        image = self.Get(key)
+        if image is None:
+            title, coords, dialect = adrLibDat.ParseDatText(adrLibDat.DecodeText(raw), filename)
+            image = RenderThumb(coords)
+            self.Put(key, image)
+        return image
+
+    def __len__(self):
+        return len(self.files)
+
+
+class ThumbLoader(QtCore.QObject):
+    """
+    Thumbnails loaded in a background thread, last requested first (rows
+    just scrolled into view). ready(filename, image) is emitted for each
+    request, with a null image if the file can't be read.
+    """
+    ready = QtCore.Signal(str, QtGui.QImage)
+
+    def __init__(self, cache, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.lock = threading.Lock()
+        self.todo = []          # stack of file names
+        self.pending = set()
+        self.thread = None
+
+    def Request(self, filename):
+        with self.lock:
+            if filename in self.pending:
+                return
+            self.pending.add(filename)
+            self.todo.append(filename)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.Run, name="AderFoilThumbs", daemon=True)
+                self.thread.start()
+
+    def Clear(self):
+        "forget requests not yet rendered"
+        with self.lock:
+            self.pending.difference_update(self.todo)
+            self.todo = []
+
+    def Run(self):
+        while True:
+            with self.lock:
+                if not self.todo:
+                    self.thread = None
+                    return
+                filename = self.todo.pop()
+            try:
+                image = self.cache.Thumb(filename)
+            except (OSError, ValueError):
+                image = QtGui.QImage()
+            with self.lock:
+                self.pending.discard(filename)
+            self.ready.emit(filename, image)
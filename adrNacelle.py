@@ -7,12 +7,19 @@
 #*   Generate a nacelle volume.                                                *
 #*     - optinal shapes : Hoerner, Lyon, Duhamel, NACA.                        *
 #*     - 0° to 360° volume.                                                    *
+#*     - fast solid : B-spline meridian revolved in a Part::Feature            *
+#*     - parametric nacelle (Part::FeaturePython), shape cached by parameters  *
+#*     - metrics (volume, areas, fineness) shown before creation               *
 #*                                                                             *
 #*  Dependencies :                                                             *
 #*     - adrNacelle.ui : GUI.                                                  *
 #*     - adrLibShapes : profils coordinates generation                         *
 #*                                                                             *
 #*  History :                                                                  *
+#*     2026-10-18 : adaptive profiles (curvature, chord height tolerance),     *
+#*                  Hoerner max thickness position passed, fast solid mode,    *
+#*                  parametric nacelle object, metrics, Polyline coords,       *
+#*                  lean sketches, batch build                                 *
 #*     2021-10-11 : correction Naca                                            *
 #*     2021-07-11 : Initial release for v 0.1 tested on FreeCAD 0.19           *
 #*                                                                             *
@@ -32,8 +39,11 @@ import FreeCADGui as Gui
 import Part
 import Sketcher
 import os
+import hashlib
+from collections import OrderedDict
 from PySide import QtUiTools
 import adrLibShapes
+import adrLibGeom
 import adrLibPart
 
 debugNacelle= False
@@ -44,6 +54,120 @@ ui_file=  os.path.join(wb.resources_path, 'adrNacelle.ui')
 icon_cmd= os.path.join(wb.icons_path,     'adrNacelle.svg')
 	
 	
+nacelleTypes = ["Lyon", "Hoerner", "Duhamel", "NACA"]
+
+# last shapes, keyed by parameters hash (shared by identical nacelles)
+shapeCache = OrderedDict()
+shapeCacheSize = 16
+
+def NacelleCoords(nacelleType, length, diameter, XMaxRel=0.4, nbPoints=100, tolerance=None):
+    "meridian (Polyline) of a nacelle type, see adrLibShapes generators"
+    if nacelleType not in nacelleTypes:
+        raise ValueError(wb.translate("Ader", "Unknown nacelle type : ") + str(nacelleType))
+    return adrLibShapes.NacellePolyline(nacelleType, length, diameter, XMaxRel or 0.4, nbPoints, tolerance)
+
+def MakeNacelle(nacelleType="Lyon", length=1000, diameter=400, XMaxRel=0.4, nbPoints=100, tolerance=0.05,
+                angle=360, name='Nacelle', doc=None):
+    "parametric nacelle (Part::FeaturePython)"
+    if doc == None:
+        doc=App.ActiveDocument
+    if doc == None:
+        raise Exception(wb.translate("Ader", "No active document")) 
+    obj = doc.addObject("Part::FeaturePython", name)
+    Nacelle(obj)
+    if App.GuiUp:
+        ViewProviderNacelle(obj.ViewObject)
+    obj.NacelleType = nacelleType
+    obj.Length = length
+    obj.Diameter = diameter
+    obj.XMaxRel = XMaxRel
+    obj.NbPoints = nbPoints
+    obj.Tolerance = tolerance
+    obj.RevolveAngle = angle
+    return obj
+
+
+class Nacelle:
+    """
+    Parametric nacelle : solid of revolution of a low drag body meridian.
+    The shape is rebuilt only when the parameters hash changes.
+    """
+    def __init__(self, obj):
+        obj.Proxy = self
+        obj.addProperty("App::PropertyEnumeration", "NacelleType", "Nacelle",
+                        wb.translate("Ader", "Shape of the nacelle"))
+        obj.NacelleType = nacelleTypes
+        obj.addProperty("App::PropertyLength", "Length", "Nacelle",
+                        wb.translate("Ader", "Length (along X)"))
+        obj.addProperty("App::PropertyLength", "Diameter", "Nacelle",
+                        wb.translate("Ader", "Max diameter"))
+        obj.addProperty("App::PropertyFloatConstraint", "XMaxRel", "Nacelle",
+                        wb.translate("Ader", "Relative position of the max diameter (Hoerner)"))
+        obj.XMaxRel = (0.4, 0.01, 0.99, 0.01)
+        obj.addProperty("App::PropertyIntegerConstraint", "NbPoints", "Nacelle",
+                        wb.translate("Ader", "Number of points (max if adaptive)"))
+        obj.NbPoints = (100, 10, 1000, 1)
+        obj.addProperty("App::PropertyLength", "Tolerance", "Nacelle",
+                        wb.translate("Ader", "Chord height tolerance of adaptive points, 0 : points evenly spaced"))
+        obj.addProperty("App::PropertyAngle", "RevolveAngle", "Nacelle",
+                        wb.translate("Ader", "Revolve angle"))
+        obj.RevolveAngle = 360
+        obj.addProperty("App::PropertyString", "ShapeKey", "Nacelle",
+                        wb.translate("Ader", "Parameters hash of the shape"))
+        obj.setEditorMode("ShapeKey", 2)     # hidden
+
+    def Key(self, obj):
+        "hash of the parameters the shape depends on"
+        params = (obj.NacelleType, obj.Length.Value, obj.Diameter.Value, obj.XMaxRel,
+                  obj.NbPoints, obj.Tolerance.Value, obj.RevolveAngle.Value)
+        return hashlib.sha1(repr(params).encode()).hexdigest()
+
+    def onChanged(self, fp, prop):
+        wb.debugMsg("Nacelle: Change property  " + str(prop) + "\n", debugNacelle)
+
+    def execute(self, fp):
+        key = self.Key(fp)
+        if key == fp.ShapeKey and not fp.Shape.isNull():
+            wb.debugMsg("Nacelle : shape unchanged\n", debugNacelle)
+            return
+        shape = shapeCache.get(key)
+        if shape is None:
+            XMaxRel = fp.XMaxRel if fp.NacelleType == "Hoerner" else 0
+            coords = NacelleCoords(fp.NacelleType, fp.Length.Value, fp.Diameter.Value, XMaxRel,
+                                   fp.NbPoints, fp.Tolerance.Value or None)
+            shape = adrLibPart.RevolutionShape(coords, fp.RevolveAngle.Value)
+            shapeCache[key] = shape
+            while len(shapeCache) > shapeCacheSize:
+                shapeCache.popitem(last=False)
+        else:
+            shapeCache.move_to_end(key)
+        placement = fp.Placement
+        fp.Shape = shape.copy()
+        fp.Placement = placement
+        fp.ShapeKey = key
+
+    def __getstate__(self):
+        return None
+
+    def __setstate__(self, state):
+        return None
+
+
+class ViewProviderNacelle:
+    def __init__(self, obj):
+        """Set this object to the proxy object of the actual view provider"""
+        obj.Proxy = self
+
+    def getIcon(self):
+        return icon_cmd
+
+    def __getstate__(self):
+        return None
+
+    def __setstate__(self, state):
+        return None
+
+
 class CommandNacelle:
     "the Nacelle command definition"
 
@@ -58,37 +182,81 @@ class CommandNacelle:
     def Activated(self):
         wb.InTaskPanel(self, ui_file)
 
+    def LocalInitTaskValues(self):
+        "metrics updated as parameters change, values by default"
+        for sb in (self.form.sbLength, self.form.sbDiameter, self.form.sbXMaxRel):
+            sb.valueChanged.connect(self.UpdateMetrics)
+        for rb in (self.form.rbLyon, self.form.rbHoerner, self.form.rbDuhamel, self.form.rbNACA):
+            rb.toggled.connect(self.UpdateMetrics)
+        self.UpdateMetrics()
+        return False
+
+    def SelectedType(self):
+        if self.form.rbLyon.isChecked():
+            return "Lyon"
+        elif self.form.rbHoerner.isChecked():
+            return "Hoerner"
+        elif self.form.rbDuhamel.isChecked():
+            return "Duhamel"
+        return "NACA"
+
+    def UpdateMetrics(self, *args):
+        "volume, areas, fineness of the current shape, before anything is created"
+        length = self.form.sbLength.value()
+        diameter = self.form.sbDiameter.value()
+        if length <= 0 or diameter <= 0:
+            self.form.lMetrics.setText('')
+            return
+        m = adrLibGeom.CachedNacelleMetrics(self.SelectedType(), length, diameter, self.form.sbXMaxRel.value())
+        self.form.lMetrics.setText(
+            wb.translate("Ader", "Volume : ") + f"{m['volume']*1e-6:.3f} dm³, " +
+            wb.translate("Ader", "wetted area : ") + f"{m['wettedArea']*1e-6:.4f} m², " +
+            wb.translate("Ader", "frontal area : ") + f"{m['frontalArea']*1e-6:.4f} m², " +
+            wb.translate("Ader", "fineness : ") + f"{m['fineness']:.2f}, " +
+            wb.translate("Ader", "max diameter : ") + f"{m['maxDiameter']:.1f} mm " +
+            wb.translate("Ader", "at ") + f"{100*m['xMaxRel']:.0f} %")
+
     def accept(self):      
+        with wb.BatchBuild(name=wb.translate("Ader","Nacelle")):
+            self.Build()
+        wb.TaskTerminated(self)
+
+    def Build(self):
+        "nacelle of the form values : parametric object, solid or sketch and feature"
         XMaxRel= 0
         length=self.form.sbLength.value()
         diameter=self.form.sbDiameter.value()
         nbPoints = self.form.sbNbPoints.value()
-        if self.form.rbLyon.isChecked():
-            nacelleType="Lyon"
-            coords= adrLibShapes.getLyonCoords(length, diameter, nbPoints)
-        elif self.form.rbHoerner.isChecked():
-            nacelleType="Hoerner"
-            coords= adrLibShapes.getHoernerCoords(length, diameter, nbPoints)
+        # adaptive : points placed by curvature, nbPoints is the max
+        tolerance = self.form.sbTolerance.value() if self.form.ckAdaptive.isChecked() else None
+        nacelleType= self.SelectedType()
+        if nacelleType == "Hoerner":
             XMaxRel= self.form.sbXMaxRel.value()
-        elif self.form.rbDuhamel.isChecked():
-            nacelleType="Duhamel"
-            coords= adrLibShapes.getDuhamelCoords(length, diameter, nbPoints)
-        else:
-            nacelleType="NACA"
-            coords= adrLibShapes.getNACACoords(length, diameter, nbPoints)
+
+        # parametric object : shape computed on recompute
+        if self.form.rbParametric.isChecked():
+            MakeNacelle(nacelleType, length, diameter, self.form.sbXMaxRel.value(), nbPoints, tolerance or 0,
+                        self.form.sbRevolveAngle.value())
+            return
+
+        coords= NacelleCoords(nacelleType, length, diameter, XMaxRel, nbPoints, tolerance)
+        wb.debugMsg(f"{nacelleType} : {len(coords)} points\n", debugNacelle)
+
+        # fast solid : one Part::Feature, no body, sketch or solver
+        if self.form.rbSolid.isChecked():
+            adrLibPart.MakeRevolutionFeature(coords, self.form.sbRevolveAngle.value(), 'n'+nacelleType)
+            return
 
         if self.form.ckNewBody.isChecked():
             body=App.ActiveDocument.addObject('PartDesign::Body','Nacelle')
         else:
             body=Gui.ActiveDocument.ActiveView.getActiveObject('pdbody')
 
-        vects = []
-        for coord in reversed(coords):
-            vects.append(coord)
-        # complete 
-        if not self.form.rbRevolve.isChecked():
-            for coord in coords[1:]:
-                vects.append(App.Vector(coord.x, -coord.y, 0))
+        # tail to nose, complete with the symmetric half if not revolved
+        if self.form.rbRevolve.isChecked():
+            vects = adrLibPart.Vectors(coords.Reversed())
+        else:
+            vects = adrLibPart.SymmetricVectors(coords)
         sk=adrLibPart.MakeSpline(vects, 'sk'+nacelleType, body=body)
 
         # make pad
@@ -102,7 +270,7 @@ class CommandNacelle:
             # close sketch with line
             sk.addGeometry([Part.LineSegment(vects[0],vects[-1])],False)
             constraintList = []
-            nbPoints=self.form.sbNbPoints.value()   # ????
+            nbPoints=len(coords)
             iC=2*nbPoints+4     # should be +2 : 1 point + cercle overhead ?
             # constraintList.append(Sketcher.Constraint('Coincident', iC, 1, nbPoints, 2))
             # constraintList.append(Sketcher.Constraint('Coincident', iC, 2, nbPoints, 1))
@@ -113,9 +281,6 @@ class CommandNacelle:
             # make revolution
             adrLibPart.MakeRevolution(sk, self.form.sbRevolveAngle.value(), 'r'+nacelleType)
             sk.Visibility = False
-          
-        wb.TaskTerminated(self)
-        App.ActiveDocument.recompute()
 
 
 if App.GuiUp:
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# ******************************************************************************
+#*  Ader workbench                                                             *
+#*    For more details see InitGui.py and the LICENCE text file.               *
+#*                                                                             *
+#*  Module : adrNacelleArray.py                                                *
+#*   Place copies of a nacelle (engines, pods) from a table of positions.      *
+#*     - one App::Link array : the nacelle geometry is computed and            *
+#*       tessellated once, whatever the number of copies.                      *
+#*     - optional symmetric copies (-Y).                                       *
+#*                                                                             *
+#*  Dependencies :                                                             *
+#*     - adrNacelleArray.ui : GUI.                                             *
+#*                                                                             *
+#*  History :                                                                  *
+#*     2026-10-18 : Initial release, batch build                               *
+#*                                                                             *
+#*******************************************************************************
+''' @package adrNacelleArray
+    Places copies of a nacelle as an App::Link array.
+'''
+__title__="FreeCAD Ader Nacelle array"
+__author__ = "Claude GUTH"
+__url__ = ""
+
+
+import FreeCAD as App
+import FreeCADGui as Gui
+import os
+from PySide import QtGui
+
+debugNacelleArray= False
+
+# resources ui, icon
+import adrWBCommon as wb
+ui_file=  os.path.join(wb.resources_path, 'adrNacelleArray.ui')
+icon_cmd= os.path.join(wb.icons_path,     'adrNacelle.svg')
+
+
+def Positions(rows, mirror=False):
+    "positions (x, y, z) of rows, symmetric positions (-y) added if mirror"
+    positions = []
+    for x, y, z in rows:
+        positions.append((x, y, z))
+        if mirror and abs(y) > 1e-9:
+            positions.append((x, -y, z))
+    return positions
+
+def MakeNacelleArray(source, positions, name='NacelleArray', doc=None):
+    """
+    App::Link array of source at positions (x, y, z) : the linked geometry
+    is shared, only placements are stored.
+    """
+    if doc == None:
+        doc=App.ActiveDocument
+    if doc == None:
+        raise Exception(wb.translate("Ader", "No active document"))
+    if not positions:
+        raise Exception(wb.translate("Ader", "No position"))
+    link = doc.addObject('App::Link', name)
+    link.setLink(source)
+    link.ShowElement = False      # placements only, no element objects
+    link.ElementCount = len(positions)
+    link.PlacementList = [App.Placement(App.Vector(x, y, z), App.Rotation()) for x, y, z in positions]
+    link.Label = source.Label + ' x' + str(len(positions))
+    return link
+
+
+class CommandNacelleArray:
+    "the Nacelle array command definition"
+
+    def GetResources(self):
+        return {'Pixmap': icon_cmd,
+		'MenuText': wb.translate("Ader","Nacelle array"),
+		'ToolTip' : wb.translate("Ader","Copies of the selected nacelle at several positions (links)")}
+
+    def IsActive(self):
+        return not App.ActiveDocument is None and len(Gui.Selection.getSelection()) == 1
+
+    def Activated(self):
+        self.source = Gui.Selection.getSelection()[0]
+        wb.InTaskPanel(self, ui_file)
+
+    def LocalInitTaskValues(self):
+        "source name, positions from the last use, other values by default"
+        self.form.lSourceName.setText(self.source.Label)
+        tw = self.form.twPlacements
+        tw.horizontalHeader().setSectionResizeMode(QtGui.QHeaderView.Stretch)
+        self.form.pbAdd.clicked.connect(self.OnAdd)
+        self.form.pbRemove.clicked.connect(self.OnRemove)
+        saved = str(wb.GetValue(self.form.objectName(), 'positions', ''))
+        rows = [row.split(',') for row in saved.split(';') if row.count(',') == 2]
+        if not rows:
+            base = self.source.Placement.Base
+            rows = [(base.x, base.y, base.z)]
+        for row in rows:
+            self.AddRow(row)
+        return False
+
+    def AddRow(self, values):
+        tw = self.form.twPlacements
+        i = tw.rowCount()
+        tw.insertRow(i)
+        for j, value in enumerate(values):
+            tw.setItem(i, j, QtGui.QTableWidgetItem(f"{float(value):g}"))
+
+    def OnAdd(self):
+        "new row, copy of the current one"
+        tw = self.form.twPlacements
+        i = tw.currentRow() if tw.currentRow() >= 0 else tw.rowCount() - 1
+        self.AddRow(self.Row(i) if i >= 0 else (0, 0, 0))
+
+    def OnRemove(self):
+        tw = self.form.twPlacements
+        if tw.currentRow() >= 0:
+            tw.removeRow(tw.currentRow())
+
+    def Row(self, i):
+        "x, y, z of row i, empty cells as 0"
+        tw = self.form.twPlacements
+        values = []
+        for j in range(3):
+            item = tw.item(i, j)
+            text = item.text().strip().replace(',', '.') if item else ''
+            try:
+                values.append(float(text) if text else 0.0)
+            except ValueError:
+                raise Exception(wb.translate("Ader", "Invalid position : ") + text)
+        return tuple(values)
+
+    def Rows(self):
+        return [self.Row(i) for i in range(self.form.twPlacements.rowCount())]
+
+    def LocalSaveTaskValues(self):
+        "save positions, other values by default"
+        positions = ';'.join(','.join(f"{v:g}" for v in row) for row in self.Rows())
+        wb.SaveValue(self.form.objectName(), 'positions', positions)
+        return False
+
+    def accept(self):
+        positions = Positions(self.Rows(), self.form.ckMirror.isChecked())
+        with wb.BatchBuild(name=wb.translate("Ader","Nacelle array")):
+            MakeNacelleArray(self.source, positions)
+            if self.form.ckHideSource.isChecked():
+                self.source.Visibility = False
+        wb.debugMsg(f"Nacelle array : {len(positions)} links\n", debugNacelleArray)
+        wb.TaskTerminated(self)
+
+
+if App.GuiUp:
+    #register the FreeCAD command
+    Gui.addCommand('adrNacelleArray', CommandNacelleArray())
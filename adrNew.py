@@ -9,6 +9,7 @@
 #*  Dependencies :                                                             *
 #*                                                                             *
 #*  History :                                                                  *
+#*    2026-10-18 : batch build (one recompute, view fit)                       *
 #*    2023-07-13 : Initial release, tested on FreeCAD 0.20                     *
 #*                                                                             *
 # ******************************************************************************
@@ -67,20 +68,19 @@ class CommandNew:
         spec.fus_w = float(w) / 1000
         spec.fus_h = float(h) / 1000   
         
-        # set bodies
-        bf=doc.addObject('PartDesign::Body','Fuselage')
-        bf.Label = wb.translate("Ader", "Fuselage")
-        bw=doc.addObject('PartDesign::Body','Wing')
-        bw.Label = wb.translate("Ader", "Wing")
-        bs=doc.addObject('PartDesign::Body','Stabilizer')
-        bs.Label = wb.translate("Ader", "Stabilizer")
+        # one recompute and view fit at the end
+        with wb.BatchBuild(doc, name=wb.translate("Ader", "Create a new airplane")):
+            # set bodies
+            bf=doc.addObject('PartDesign::Body','Fuselage')
+            bf.Label = wb.translate("Ader", "Fuselage")
+            bw=doc.addObject('PartDesign::Body','Wing')
+            bw.Label = wb.translate("Ader", "Wing")
+            bs=doc.addObject('PartDesign::Body','Stabilizer')
+            bs.Label = wb.translate("Ader", "Stabilizer")
 
-        # set top/face views
-        adrLibShapes.MakeTopView(l, w, body=bf)
-        adrLibShapes.MakeFaceView(l, h, body=bf)
-        
-        doc.recompute()
-        Gui.SendMsgToActiveView("ViewFit")
+            # set top/face views
+            adrLibShapes.MakeTopView(l, w, body=bf)
+            adrLibShapes.MakeFaceView(l, h, body=bf)
 
 
 if App.GuiUp:
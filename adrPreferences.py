@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# ******************************************************************************
+#*  Ader workbench                                                             *
+#*    For more details see InitGui.py and the LICENCE text file.               *
+#*                                                                             *
+#*  Module : adrPreferences.py                                                 *
+#*   Ader page of the FreeCAD preferences (Edit > Preferences).                *
+#*     - values stored in Ader.ini, section of the form name                   *
+#*       (see adrWBCommon.GetPreference).                                      *
+#*                                                                             *
+#*  Dependencies :                                                             *
+#*     - adrPreferences.ui : GUI.                                              *
+#*                                                                             *
+#*  History :                                                                  *
+#*     2026-10-18 : Initial release, lean sketches, spline fit, bulk builds    *
+#*                                                                             *
+#*******************************************************************************
+''' @package adrPreferences
+    Ader preferences page.
+'''
+__title__="FreeCAD Ader Preferences"
+__author__ = "Claude GUTH"
+__url__ = ""
+
+
+import FreeCADGui as Gui
+import os
+
+# resources ui
+import adrWBCommon as wb
+ui_file=  os.path.join(wb.resources_path, 'adrPreferences.ui')
+
+
+class PreferencesPage:
+    "the Ader preferences page, values saved as the task panels ones"
+
+    def __init__(self):
+        self.form = Gui.PySideUic.loadUi(ui_file)
+
+    def loadSettings(self):
+        wb.InitFormValues(self.form)
+
+    def saveSettings(self):
+        wb.SaveFormValues(self.form)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# ******************************************************************************
+#*  Ader workbench                                                             *
+#*    For more details see InitGui.py and the LICENCE text file.               *
+#*                                                                             *
+#*  Module : adrPromoteSketch.py                                               *
+#*   Promote lean sketches (B-splines only) to the editable form :             *
+#*     knot points aligned on the B-splines, poles exposed.                    *
+#*                                                                             *
+#*  Dependencies :                                                             *
+#*     - adrLibPart : PromoteSketch                                            *
+#*                                                                             *
+#*  History :                                                                  *
+#*     2026-10-18 : Initial release, batch build                               *
+#*                                                                             *
+#*******************************************************************************
+''' @package adrPromoteSketch
+    Makes the B-splines of the selected lean sketches editable.
+'''
+__title__="FreeCAD Ader Promote sketch"
+__author__ = "Claude GUTH"
+__url__ = ""
+
+
+import FreeCAD as App
+import FreeCADGui as Gui
+import os
+import adrLibPart
+
+debugPromote= False
+
+# resources icon
+import adrWBCommon as wb
+icon_cmd= os.path.join(wb.icons_path,     'adrFoil.svg')
+
+
+def SelectedSketches():
+    return [obj for obj in Gui.Selection.getSelection() if obj.isDerivedFrom('Sketcher::SketchObject')]
+
+
+class CommandPromoteSketch:
+    "the Promote sketch command definition"
+
+    def GetResources(self):
+        return {'Pixmap': icon_cmd,
+                'MenuText': wb.translate("Ader","Promote sketch"),
+                'ToolTip' : wb.translate("Ader","Knot points and poles added to the B-splines of the selected lean sketches, to edit them")}
+
+    def IsActive(self):
+        return not App.ActiveDocument is None and len(SelectedSketches()) > 0
+
+    def Activated(self):
+        nb = 0
+        with wb.BatchBuild(viewFit=False, name=wb.translate("Ader","Promote sketch")):
+            for sk in SelectedSketches():
+                nb += adrLibPart.PromoteSketch(sk)
+        wb.debugMsg(f"Promote sketch : {nb} B-splines\n", debugPromote)
+
+
+if App.GuiUp:
+    #register the FreeCAD command
+    Gui.addCommand('adrPromoteSketch', CommandPromoteSketch())
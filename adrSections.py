@@ -11,6 +11,7 @@
 #*     - adrLibPart : section plane generation                                 *
 #*                                                                             *
 #*  History :                                                                  *
+#*     2026-10-18 : batch build (one recompute, view fit)                      *
 #*     2025-09-19 : Initial release tested on FreeCAD 1.0.2                    *
 #*                                                                             *
 #*******************************************************************************
@@ -57,11 +58,9 @@ class CommandSections:
     def accept(self):
         # make sections
         nb= self.form.sbNbSections.value()
-        adrLibPart.MakeIntersectionPlanes(nb)
+        with wb.BatchBuild(name=wb.translate("Ader","Sections")):
+            adrLibPart.MakeIntersectionPlanes(nb)
         wb.TaskTerminated(self)
-    
-        # display
-        App.ActiveDocument.recompute()
 
 
 if App.GuiUp:
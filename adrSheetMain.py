@@ -9,6 +9,7 @@
 #*  Dependencies :                                                             *
 #*                                                                             *
 #*  History :                                                                  *
+#*    2026-10-18 : foil points, NACA designations                              *
 #*    2023-07-12 : Initial release, tested on FreeCAD 0.20                     *
 #*                                                                             *
 # ******************************************************************************
@@ -47,20 +48,21 @@ wingParams = [
     {"alias": "dieth",      "unite": "m", "value": "0.001",  "description": "Dièdre"},
     {"alias": "fleche",     "unite": "°", "value": "0.001",  "description": "Flèche"},
     {"alias": "ci",         "unite": "m", "value": "",  "description": "Corde interne"},
-    {"alias": "ci_profile", "unite": "",  "value": "",  "description": "Profil interne (fichier *.dat)"},
+    {"alias": "ci_profile", "unite": "",  "value": "",  "description": "Profil interne (fichier *.dat ou NACAxxxx)"},
     {"alias": "ci_cal",     "unite": "°", "value": "",  "description": "Calage interne"},
     {"alias": "ce",         "unite": "m", "value": "",  "description": "Corde à l'extrémité"},
-    {"alias": "ce_profile", "unite": "",  "value": "",  "description": "Profil à l'extrémité (fichier *.dat)"},
+    {"alias": "ce_profile", "unite": "",  "value": "",  "description": "Profil à l'extrémité (fichier *.dat ou NACAxxxx)"},
     {"alias": "ce_cal",     "unite": "°", "value": "",  "description": "Calage à l'extrémité"},
+    {"alias": "foil_points", "unite": "", "value": "0", "description": "Points par profil (0 : points du fichier)"},
 ]
 stabParams = [
     {"alias": "s_x",        "unite": "m", "value": "0", "description": "Position x"},
     {"alias": "s_z",        "unite": "m", "value": "0", "description": "Position z"},
-    {"alias": "vs_profile", "unite": "",  "value": "",  "description": "Profil dérive (fichier *.dat)"},
+    {"alias": "vs_profile", "unite": "",  "value": "",  "description": "Profil dérive (fichier *.dat ou NACAxxxx)"},
     {"alias": "vs_length",  "unite": "m", "value": "",  "description": "Envergure dérive"},
     {"alias": "vs_ci",      "unite": "m", "value": "",  "description": "Corde interne"},
     {"alias": "vs_ce",      "unite": "m", "value": "",  "description": "Corde à l'extrémité"},
-    {"alias": "hs_profile", "unite": "",  "value": "",  "description": "Profil profondeur (fichier *.dat)"},
+    {"alias": "hs_profile", "unite": "",  "value": "",  "description": "Profil profondeur (fichier *.dat ou NACAxxxx)"},
     {"alias": "hs_length",  "unite": "m", "value": "",  "description": "Envergure profondeur"},
     {"alias": "hs_ci",      "unite": "m", "value": "",  "description": "Corde interne"},
     {"alias": "hs_ce",      "unite": "m", "value": "",  "description": "Corde à l'extrémité"},
@@ -8,8 +8,14 @@
 #*     - path to resources...                                                  *
 #*     - translation for python modules                                        *
 #*     - messages : debug, console                                             *
+#*     - airfoil catalog                                                       *
 #*                                                                             *
 #*   History :                                                                 *
+#*     2026-10-18 : airfoil catalog index, foil analysis, similarity search,   *
+#*                  full text search, thumbnails, NACA designations,           *
+#*                  preferences (lean sketches, spline fit), batch builds      *
+#*                  in one transaction, bulk builds (no undo), foil libraries  *
+#*                  imported on first use                                      *
 #*     2023-07-12 : Initial release Claude GUTH                                *
 #*                                                                             *
 #*******************************************************************************
@@ -20,6 +26,7 @@ __url__ = "https://.fr"
 
 import configparser
 import os
+import threading
 import FreeCAD as App
 import FreeCADGui as Gui
 import PySide
@@ -56,16 +63,171 @@ def consoleMsg(msg, type=None):
     else:
         App.Console.PrintMessage(msg)
 
+# airfoil catalog handling, libraries imported on first use (FreeCAD start up)
+catalogFilename= os.path.join(base_path, "dat_catalog.json")
+packFilename= os.path.join(base_path, "dat_profiles.adrpack")
+analysisFilename= os.path.join(base_path, "dat_analysis.json")
+featuresFilename= os.path.join(base_path, "dat_features.npz")
+searchFilename= os.path.join(base_path, "dat_search.sqlite")
+thumbsFolder= os.path.join(base_path, "dat_thumbs")
+foilCatalog= None
+foilAnalysis= None
+foilIndex= None
+foilSearch= None
+foilThumbs= None
+foilPrewarm= None
+foilLock= threading.RLock()          # catalog objects creation
+foilUpdateLock= threading.RLock()    # refresh / update, one at a time
+
+def DatFolders():
+    "dat_profiles folder + user folders (Ader.ini [Foils] UserDatPaths, os.pathsep separated)"
+    folders=[dat_path]
+    userPaths= GetValue('Foils', 'UserDatPaths', '')
+    if isinstance(userPaths, str):
+        for f in userPaths.split(os.pathsep):
+            f= f.strip()
+            if f and os.path.isdir(f) and f not in folders:
+                folders.append(f)
+    return folders
+
+def GetFoilCatalog(refresh=None, progress=None):
+    """
+    Airfoil catalog, created and refreshed once per session.
+    refresh : None at creation only, False never (index file entries), True always.
+    Entries from the index file are available while it is refreshed.
+    """
+    import adrLibCatalog
+    global foilCatalog
+    with foilLock:
+        if foilCatalog is None or foilCatalog.folders != DatFolders():
+            foilCatalog= adrLibCatalog.FoilCatalog(DatFolders(), catalogFilename)
+            if refresh is None:
+                refresh= True
+        catalog= foilCatalog
+    if refresh:
+        with foilUpdateLock:
+            nb= catalog.Refresh(progress=progress)
+        debugMsg(f"Foil catalog : {nb} files read\n", localDebug)
+    return catalog
+
+def GetFoilAnalysis(update=False, progress=None):
+    "geometric metrics of the catalog foils, updated for changed files if required"
+    import adrLibCatalog, adrLibAnalysis
+    global foilAnalysis
+    with foilLock:
+        if foilAnalysis is None:
+            foilAnalysis= adrLibAnalysis.FoilAnalysis(analysisFilename)
+        analysis= foilAnalysis
+    if update:
+        with foilUpdateLock:
+            nb= analysis.Update(GetFoilCatalog().Entries(status=adrLibCatalog.statusOk), progress=progress)
+        debugMsg(f"Foil analysis : {nb} foils computed\n", localDebug)
+    return analysis
+
+def GetFoilIndex(update=False):
+    "similarity index of the catalog foils, updated for changed files if required"
+    import adrLibCatalog, adrLibSimilar
+    global foilIndex
+    with foilLock:
+        if foilIndex is None:
+            foilIndex= adrLibSimilar.FoilIndex(featuresFilename)
+            update= True
+        index= foilIndex
+    if update:
+        with foilUpdateLock:
+            nb= index.Update(GetFoilCatalog().Entries(status=adrLibCatalog.statusOk))
+        debugMsg(f"Foil index : {nb} foils computed\n", localDebug)
+    return index
+
+def GetFoilSearch(update=False):
+    "search database of the catalog foils, synced with catalog and analysis if required"
+    import adrLibCatalog, adrLibSearch
+    global foilSearch
+    with foilLock:
+        if foilSearch is None:
+            foilSearch= adrLibSearch.FoilSearch(searchFilename)
+        search= foilSearch
+    if update:
+        with foilUpdateLock:
+            nb= search.Sync(GetFoilCatalog().Entries(status=adrLibCatalog.statusOk), GetFoilAnalysis().Get)
+        debugMsg(f"Foil search : {nb} foils written\n", localDebug)
+    return search
+
+def SearchFoils(text='', ranges=None, limit=None):
+    """
+    Catalog foils matching text : words searched in file names and titles,
+    range conditions as thickness>10% points<100 camber=1%..3%.
+    ranges : [(column, min, max)], column in adrLibAnalysis metrics keys,
+    bounds included (optional 4th item True : excluded).
+    Returns dicts (path, file, folder, title, metrics...) sorted by file.
+    """
+    return GetFoilSearch().Search(text, ranges, limit)
+
+def GetThumbCache():
+    "disk cache of the foil thumbnails, size from Ader.ini [Foils] ThumbCacheSize"
+    import adrLibThumbs
+    global foilThumbs
+    with foilLock:
+        if foilThumbs is None:
+            maxFiles= GetValue('Foils', 'ThumbCacheSize', 5000)
+            foilThumbs= adrLibThumbs.ThumbCache(thumbsFolder, maxFiles)
+        return foilThumbs
+
+def PrewarmFoilCatalog():
+    "refresh catalog and analysis in a background thread (workbench activation)"
+    global foilPrewarm
+    if foilPrewarm is not None:
+        return foilPrewarm
+    def prewarm():
+        GetFoilCatalog(refresh=True)
+        GetFoilAnalysis(update=True)
+        GetFoilSearch(update=True)
+    foilPrewarm= threading.Thread(target=prewarm, name="AderFoilPrewarm", daemon=True)
+    foilPrewarm.start()
+    return foilPrewarm
+
+def SimilarFoils(profile, k=10):
+    """
+    k library foils most similar to a profile : file name (spec cell) or
+    coords ((N, 2) or list of vectors). Returns [(file name, distance)].
+    """
+    import adrLibDat, adrLibNaca
+    if isinstance(profile, str):
+        filename= DatFilePath(profile)
+        if adrLibNaca.IsNaca(filename):
+            title, coords= adrLibNaca.NacaFoil(filename)
+        else:
+            title, coords= adrLibDat.ReadDat(filename)
+    else:
+        coords= [(v[0], v[1]) for v in profile]
+    return [(os.path.basename(p), d) for p, d in GetFoilIndex().Similar(coords, k)]
+
+def DatFilePath(datFile):
+    """
+    full path of a foil file from its name (extension optional),
+    NACA designations (NACA2412...) without a library file returned as
+    is : generated foils
+    """
+    import adrLibNaca
+    if os.path.isabs(datFile):
+        return datFile
+    filename= GetFoilCatalog().Path(datFile)
+    if filename is None:
+        # unknown in catalog : default folder
+        filename= os.path.join(dat_path, datFile)
+        if os.path.splitext(filename)[1] == '':
+            filename += '.dat'
+        if not os.path.exists(filename) and adrLibNaca.IsNaca(datFile):
+            return datFile
+    return filename
+
 def ListDatProfiles():
-    "list profiles in dat_profiles folder (first line)"
-    files=[]
-    for f in os.listdir(dat_path): 
-        if f.endswith(".dat"):
-            files.append(f)
-    profiles=[]
-    for f in files:
-        profiles.append(open(os.path.join(dat_path, f), 'r', errors='ignore').readline().strip())
-        
+    "list profiles in dat folders (file, first line) from the catalog"
+    import adrLibCatalog
+    entries= GetFoilCatalog().Entries(status=adrLibCatalog.statusOk)
+    files= [e['file'] for e in entries]
+    profiles= [e['title'] for e in entries]
+
     return files, profiles
 
 def InTaskPanel(CommandClass, ui_file):
@@ -98,6 +260,98 @@ def TaskTerminated(CommandClass):
 
     Gui.Control.closeDialog()
 
+# build commands
+batchBuilds= True           # False : no suspension, for benchmarks
+batchDepth= 0               # nested BatchBuild, the outer one finishes
+class BatchBuild:
+    """
+    Context of a build command :
+     - one transaction named name : one undo reverts the build, aborted
+       on error ; bulk (None : Ader preferences) : no undo recording,
+     - recomputes frozen : sketches not solved, touched objects not
+       recomputed while they are populated,
+     - main window (tree, 3D view) not repainted,
+    at exit one recompute (each sketch solved once) and one view fit.
+    """
+    def __init__(self, doc=None, viewFit=True, name=None, bulk=None):
+        self.doc = doc
+        self.viewFit = viewFit
+        self.name = name
+        self.bulk = BulkBuilds() if bulk is None else bulk
+
+    def __enter__(self):
+        global batchDepth
+        if self.doc is None:
+            self.doc = App.ActiveDocument
+        if self.doc is None:
+            raise Exception(translate("Ader", "No active document"))
+        self.outer = batchDepth == 0
+        self.transaction = False
+        self.undoMode = None
+        self.frozen = None
+        self.mainWindow = None
+        self.cursor = False
+        # depth counted once set up : __exit__ is not called if __enter__ raises
+        try:
+            if self.outer:
+                if self.bulk:
+                    self.undoMode = self.doc.UndoMode
+                    self.doc.UndoMode = 0
+                elif self.name:
+                    self.doc.openTransaction(self.name)
+                    self.transaction = True
+            if batchBuilds and self.outer:
+                self.Suspend()
+        except Exception:
+            self.Resume()
+            if self.transaction:
+                self.doc.abortTransaction()
+            if self.undoMode is not None:
+                self.doc.UndoMode = self.undoMode
+            raise
+        batchDepth += 1
+        return self
+
+    def Suspend(self):
+        "recomputes frozen, main window not repainted, wait cursor"
+        self.frozen = self.doc.RecomputesFrozen
+        self.doc.RecomputesFrozen = True
+        if App.GuiUp:
+            self.mainWindow = Gui.getMainWindow()
+            self.mainWindow.setUpdatesEnabled(False)
+            QtGui.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
+            self.cursor = True
+
+    def Resume(self):
+        "undo Suspend (what was done of it)"
+        if self.frozen is not None:
+            self.doc.RecomputesFrozen = self.frozen
+        if self.cursor:
+            QtGui.QApplication.restoreOverrideCursor()
+        if self.mainWindow is not None:
+            self.mainWindow.setUpdatesEnabled(True)
+
+    def __exit__(self, excType, excValue, traceback):
+        global batchDepth
+        batchDepth -= 1
+        self.Resume()
+        if not self.outer:
+            return False
+        try:
+            if excType is not None:
+                if self.transaction:
+                    self.doc.abortTransaction()
+                return False
+            self.doc.recompute()
+            if self.viewFit and App.GuiUp:
+                Gui.SendMsgToActiveView("ViewFit")
+            if self.transaction:
+                self.doc.commitTransaction()
+        finally:
+            if self.undoMode is not None:
+                self.doc.UndoMode = self.undoMode
+        return False
+
 # persistance handling
 
 iniFilename=os.path.join(base_path, "Ader.ini")
@@ -148,6 +402,26 @@ def SaveValue(section, key, value):
     
     return True
 
+# Ader preferences (Edit > Preferences > Ader, see adrPreferences.py)
+preferencesSection= 'aderPreferences'
+def GetPreference(key, defaultValue):
+    "value of the Ader preferences page"
+    return GetValue(preferencesSection, key, defaultValue)
+
+def LeanSketches():
+    "sketches built with the B-splines only (no knot points, constraints, poles)"
+    return bool(GetPreference('ckLeanSketches', False))
+
+def FitTolerance():
+    "splines fitted to this tolerance (mm, least squares, fewest poles), 0 : interpolated"
+    if not GetPreference('ckFitSplines', False):
+        return 0.0
+    return float(GetPreference('sbFitTolerance', 0.05))
+
+def BulkBuilds():
+    "build commands without undo recording (large or scripted builds)"
+    return bool(GetPreference('ckBulkBuilds', False))
+
 def str_to_bool(s):
     """ Cast 'true', 'false', '1', '0' as bool."""
     s_lower = s.strip().lower()
@@ -158,9 +432,9 @@ def str_to_bool(s):
     else:
         raise ValueError(f"Not a boolean : {s}")
 
-def InitFormValues(form):
+def InitFormValues(form, skip=()):
     """
-    Set widgets persistent values.
+    Set widgets persistent values, widgets named in skip left unchanged.
     """
     section = form.objectName() if hasattr(form, 'objectName') else None
     if not section:
@@ -170,7 +444,7 @@ def InitFormValues(form):
         key = w.objectName() if hasattr(w, 'objectName') else None
 
         # set value, default with current object
-        if key and key != 'qt_spinbox_lineedit':
+        if key and key != 'qt_spinbox_lineedit' and key not in skip:
             if hasattr(w, "setValue"):
                 w.setValue(GetValue(section, key, w.value()) )          
             elif hasattr(w, "setChecked"):
@@ -190,9 +464,9 @@ def InitFormValues(form):
                 except Exception:
                     default_value = None
  			
-def SaveFormValues(form):
+def SaveFormValues(form, skip=()):
     """
-	Save widgets persistent values.
+	Save widgets persistent values, widgets named in skip not saved.
     """
 
     section = form.objectName() if hasattr(form, 'objectName') else None
@@ -204,7 +478,7 @@ def SaveFormValues(form):
         debugMsg(key, localDebug)
 
         # valeur par défaut prise depuis l'état courant du widget
-        if key and key != 'qt_spinbox_lineedit':
+        if key and key != 'qt_spinbox_lineedit' and key not in skip:
             if hasattr(w, "setValue"):
                 SaveValue(section, key, w.value())           
             elif hasattr(w, "setChecked"):